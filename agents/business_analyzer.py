@@ -9,224 +9,419 @@ Analyzes business profiles to extract funding-relevant characteristics.
 """
 
 import logging
-from typing import Dict, List, Any
+import sys
+from typing import Dict, List, Any, Tuple
+
+import numpy as np
+
 from config import UK_SECTORS, COMPANY_SIZES, UK_REGIONS
 
 logger = logging.getLogger(__name__)
 
+# Numeric risk codes carried through the scoring pipeline; risk levels
+# are only stringified via RISK_NAMES at the output boundary.
+RISK_LOW, RISK_MEDIUM, RISK_HIGH = 0, 1, 2
+RISK_CODES = {"low": RISK_LOW, "medium": RISK_MEDIUM, "high": RISK_HIGH}
+RISK_NAMES = ("low", "medium", "high")
+
+# business_density -> geographic risk level
+DENSITY_RISK_MAPPING = {
+    "very_high": "low",
+    "high": "low",
+    "medium": "medium",
+    "low": "high"
+}
+
+_GROWTH_SCORES = {"high": 0.8, "medium": 0.6, "low": 0.4}
+_RISK_ATTR_SCORES = {"low": 0.8, "medium": 0.6, "high": 0.3}
+
+def _sector_attractiveness(sector_info: Dict) -> float:
+    """Combined growth/risk attractiveness score for a sector entry"""
+    growth_score = _GROWTH_SCORES.get(sector_info.get("growth_potential", "medium"), 0.5)
+    risk_score = _RISK_ATTR_SCORES.get(sector_info.get("risk_level", "medium"), 0.5)
+    return (growth_score + risk_score) / 2
+
+# Sector/region lookup tables indexed by int code, built once at import.
+# The extra trailing slot carries the defaults used for unknown keys.
+SECTOR_INDEX = {name: i for i, name in enumerate(UK_SECTORS)}
+SECTOR_UNKNOWN = len(SECTOR_INDEX)
+SECTOR_RISK_CODE = np.array(
+    [RISK_CODES[info.get("risk_level", "medium")] for info in UK_SECTORS.values()]
+    + [RISK_MEDIUM],
+    dtype=np.int8
+)
+SECTOR_ATTR = np.array(
+    [_sector_attractiveness(info) for info in UK_SECTORS.values()]
+    + [_sector_attractiveness({})]
+)
+
+REGION_INDEX = {name: i for i, name in enumerate(UK_REGIONS)}
+REGION_UNKNOWN = len(REGION_INDEX)
+REGION_RISK_CODE = np.array(
+    [RISK_CODES[DENSITY_RISK_MAPPING.get(info.get("business_density", "medium"), "medium")]
+     for info in UK_REGIONS.values()]
+    + [RISK_MEDIUM],
+    dtype=np.int8
+)
+
+# Matching-tag tuples, interned and cached per (sector, size, location, age band)
+_TAG_CACHE: Dict[Tuple, Tuple[str, ...]] = {}
+
+# Canonical funding-type order; recommendations are built as a bitmask over
+# this tuple, which dedupes by construction and keeps a stable order.
+FUNDING_TYPE_ORDER = (
+    "venture_capital", "angel_investment", "bank_loan",
+    "asset_finance", "crowdfunding", "government_grant"
+)
+(_VC_BIT, _ANGEL_BIT, _BANK_BIT,
+ _ASSET_BIT, _CROWD_BIT, _GRANT_BIT) = (1 << i for i in range(6))
+
+# Red flags in bit order; _RED_FLAG_LISTS precomputes the flags for
+# every possible bitmask. Stored as tuples so a shared entry can never
+# be mutated through a returned result; callers get a fresh list.
+RED_FLAGS = ("excessive_funding_request", "very_new_business")
+_RED_FLAG_LISTS = tuple(
+    tuple(RED_FLAGS[i] for i in range(len(RED_FLAGS)) if mask >> i & 1)
+    for mask in range(1 << len(RED_FLAGS))
+)
+
+# Company size buckets, indexed by threshold count
+COMPANY_SIZE_NAMES = ("micro", "small", "medium", "large")
+
+# Risk code -> readiness weight, scalar tuple and array forms
+RISK_SCORE_BY_CODE = (1.0, 0.7, 0.4)
+RISK_SCORE_TABLE = np.array(RISK_SCORE_BY_CODE)
+
+# Max cached analyses per analyzer instance
+_ANALYSIS_CACHE_SIZE = 4096
+
+# Packed profile record for the batch path: every field the scoring math
+# needs, with sector/region already resolved to int codes.
+PROFILE_DT = np.dtype([
+    ("revenue", "f8"), ("margin", "f8"), ("cash_flow", "f8"),
+    ("age", "f8"), ("sector", "i4"), ("region", "i4")
+])
+
+def _pack_rows(keys) -> np.ndarray:
+    """Pack analysis cache keys into a PROFILE_DT record array"""
+    packed = np.empty(len(keys), dtype=PROFILE_DT)
+    for j, key in enumerate(keys):
+        packed[j] = (key[4], key[6], key[7], key[2],
+                     SECTOR_INDEX.get(key[0], SECTOR_UNKNOWN),
+                     REGION_INDEX.get(key[1], REGION_UNKNOWN))
+    return packed
+
+# Precompiled fallback analysis; the nested dicts are shared read-only,
+# only matching_tags is patched per profile.
+_FALLBACK_TEMPLATE = {
+    "business_profile": {
+        "risk_level": "medium",
+        "stage": "unknown",
+        "creditworthiness": 0.5,
+        "growth_trajectory": "stable",
+        "funding_readiness": 0.4,
+        "sector_attractiveness": 0.5
+    },
+    "funding_indicators": {
+        "amount_justification": "unknown",
+        "repayment_capacity": 0.5,
+        "asset_backing": 0.3,
+        "management_strength": 0.5
+    },
+    "matching_tags": None,
+    "red_flags": ["incomplete_data"],
+    "recommended_funding_types": ["asset_finance", "crowdfunding"]
+}
+
+def _score_kernel(revenue: float, margin: float, cash_flow: float, age: float,
+                  sector_risk_i: int, geo_risk_i: int, financial_risk_i: int,
+                  sector_attractiveness: float):
+    """
+    Fused scalar scoring kernel.
+
+    Operates on plain floats and int risk codes (RISK_LOW/MEDIUM/HIGH) and
+    returns (creditworthiness, repayment_capacity, funding_readiness,
+    overall_risk_idx) in a single call, avoiding per-score method
+    dispatch and string-keyed dict lookups on the hot path.
+    """
+    creditworthiness = (
+        min(margin * 10, 1.0) * 0.4 +
+        min(cash_flow / 6, 1.0) * 0.3 +
+        min(revenue / 1000000, 1.0) * 0.3
+    )
+
+    repayment_capacity = min((revenue * margin) / 12 / 10000, 1.0)
+
+    avg_risk = (sector_risk_i + geo_risk_i + financial_risk_i) / 3
+    overall_risk_idx = RISK_LOW if avg_risk <= 0.5 else RISK_MEDIUM if avg_risk <= 1.5 else RISK_HIGH
+
+    risk_score = RISK_SCORE_BY_CODE[overall_risk_idx]
+    funding_readiness = (
+        creditworthiness * 0.4 +
+        min(age / 10, 1.0) * 0.25 +
+        sector_attractiveness * 0.2 +
+        risk_score * 0.15
+    )
+    funding_readiness = min(max(funding_readiness, 0.0), 1.0)
+
+    return creditworthiness, repayment_capacity, funding_readiness, overall_risk_idx
+
 class BusinessAnalyzer:
     """
     Comprehensive business analysis agent for funding optimization.
     """
     
     def __init__(self):
-        self.sector_data = UK_SECTORS
-        self.regional_data = UK_REGIONS
+        self._analysis_cache: Dict[Tuple, Dict[str, Any]] = {}
         logger.info("Business Analyzer initialized")
-    
+
     def analyze_business(self, business_profile) -> Dict[str, Any]:
         """
         Main analysis function that processes business profile.
+        Results are cached on the funding-relevant profile fields.
         """
         try:
-            logger.info(f"Analyzing business: {business_profile.company_name}")
-            
-            # Core analysis components
-            demographic_analysis = self._analyze_demographics(business_profile)
-            financial_analysis = self._analyze_financials(business_profile)
-            risk_analysis = self._analyze_risk_profile(business_profile)
-            
-            # Calculate funding readiness
-            funding_readiness = self._calculate_funding_readiness(
-                demographic_analysis, financial_analysis, risk_analysis
+            logger.info("Analyzing business: %s", business_profile.company_name)
+
+            # Single pass: read each profile attribute exactly once
+            sector = business_profile.sector
+            revenue = business_profile.annual_revenue
+            employees = business_profile.employees
+            age = business_profile.business_age
+            funding_amount = business_profile.funding_amount
+            location_lc = business_profile.location.lower()
+            financials = business_profile.financials or {}
+            margin = financials.get("profit_margin", 0.1)
+            cash_flow = financials.get("cash_flow_months", 2)
+
+            cache_key = (sector, location_lc, age, employees, revenue,
+                         funding_amount, margin, cash_flow)
+            cached = self._analysis_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+            funding_ratio = funding_amount / max(revenue, 1)
+
+            sector_idx = SECTOR_INDEX.get(sector, SECTOR_UNKNOWN)
+            region_idx = REGION_INDEX.get(location_lc, REGION_UNKNOWN)
+
+            sector_risk_i = int(SECTOR_RISK_CODE[sector_idx])
+            geo_risk_i = int(REGION_RISK_CODE[region_idx])
+            financial_risk_i = self._assess_financial_risk(margin, cash_flow)
+            sector_attractiveness = float(SECTOR_ATTR[sector_idx])
+
+            # Single fused kernel call for all numeric scores
+            creditworthiness, repayment_capacity, funding_readiness, overall_risk_idx = _score_kernel(
+                revenue, margin, cash_flow, age,
+                sector_risk_i, geo_risk_i, financial_risk_i,
+                sector_attractiveness
             )
-            
+
             # Generate matching tags
-            matching_tags = self._generate_matching_tags(business_profile, demographic_analysis)
-            
+            company_size = self._determine_company_size(employees, revenue)
+            matching_tags = self._generate_matching_tags(
+                sector, location_lc, age, revenue, company_size
+            )
+
             # Compile business intelligence
             intelligence = {
                 "business_profile": {
-                    "risk_level": risk_analysis["overall_risk"],
-                    "stage": self._determine_business_stage(business_profile),
-                    "creditworthiness": financial_analysis["creditworthiness"],
-                    "growth_trajectory": "accelerating" if business_profile.business_age <= 3 else "stable",
+                    "risk_level": RISK_NAMES[overall_risk_idx],
+                    "stage": self._determine_business_stage(age, revenue),
+                    "creditworthiness": creditworthiness,
+                    "growth_trajectory": "accelerating" if age <= 3 else "stable",
                     "funding_readiness": funding_readiness,
-                    "sector_attractiveness": demographic_analysis["sector_attractiveness"]
+                    "sector_attractiveness": sector_attractiveness
                 },
                 "funding_indicators": {
-                    "amount_justification": self._assess_amount_justification(business_profile),
-                    "repayment_capacity": financial_analysis["repayment_capacity"],
-                    "asset_backing": financial_analysis["asset_backing"],
+                    "amount_justification": self._assess_amount_justification(funding_ratio),
+                    "repayment_capacity": repayment_capacity,
+                    "asset_backing": self._estimate_asset_backing(revenue, sector),
                     "management_strength": 0.75  # Simplified
                 },
                 "matching_tags": matching_tags,
-                "red_flags": self._identify_red_flags(business_profile),
-                "recommended_funding_types": self._recommend_funding_types(business_profile, funding_readiness)
+                "red_flags": self._identify_red_flags(funding_ratio, age),
+                "recommended_funding_types": self._recommend_funding_types(sector, funding_amount, funding_readiness)
             }
-            
-            logger.info(f"Business analysis completed - Readiness: {funding_readiness:.2f}")
+
+            if len(self._analysis_cache) >= _ANALYSIS_CACHE_SIZE:
+                self._analysis_cache.clear()
+            self._analysis_cache[cache_key] = intelligence
+
+            logger.info("Business analysis completed - Readiness: %.2f", funding_readiness)
             return intelligence
             
         except Exception as e:
-            logger.error(f"Error in business analysis: {str(e)}")
+            logger.error("Error in business analysis: %s", e)
             return self._create_fallback_analysis(business_profile)
-    
-    def _analyze_demographics(self, profile) -> Dict[str, Any]:
-        """Analyze business demographic characteristics"""
-        sector_info = self.sector_data.get(profile.sector, {})
-        region_info = self.regional_data.get(profile.location.lower(), {})
-        
-        return {
-            "sector": profile.sector,
-            "sector_risk": sector_info.get("risk_level", "medium"),
-            "sector_attractiveness": self._calculate_sector_attractiveness(sector_info),
-            "location": profile.location,
-            "regional_advantage": region_info.get("funding_availability", "fair"),
-            "business_age": profile.business_age,
-            "company_size": self._determine_company_size(profile.employees, profile.annual_revenue)
-        }
-    
-    def _analyze_financials(self, profile) -> Dict[str, Any]:
-        """Analyze financial health"""
-        financials = profile.financials or {}
-        
-        profit_margin = financials.get("profit_margin", 0.1)
-        cash_flow_months = financials.get("cash_flow_months", 2)
-        
-        creditworthiness = self._calculate_creditworthiness(
-            profit_margin, cash_flow_months, profile.annual_revenue
-        )
-        
-        repayment_capacity = self._calculate_repayment_capacity(
-            profile.annual_revenue, profit_margin
-        )
-        
-        asset_backing = self._estimate_asset_backing(
-            profile.annual_revenue, profile.sector
+
+    def analyze_business_batch(self, business_profiles: List) -> List[Dict[str, Any]]:
+        """
+        Analyze many business profiles in one vectorized pass.
+
+        Packs profile fields into NumPy arrays (structure-of-arrays) and
+        computes all numeric scores as array expressions, avoiding
+        per-profile Python dispatch for large broker batches.
+        Produces the same intelligence dicts as analyze_business.
+        """
+        n = len(business_profiles)
+        if n == 0:
+            return []
+
+        logger.info("Batch analyzing %d business profiles", n)
+
+        # Split cache hits from misses before doing any array work
+        results: List[Dict[str, Any]] = [None] * n
+        miss_positions = []
+        miss_keys = []
+        for i, profile in enumerate(business_profiles):
+            financials = profile.financials or {}
+            key = (profile.sector, profile.location.lower(), profile.business_age,
+                   profile.employees, profile.annual_revenue, profile.funding_amount,
+                   financials.get("profit_margin", 0.1), financials.get("cash_flow_months", 2))
+            cached = self._analysis_cache.get(key)
+            if cached is not None:
+                results[i] = cached
+            else:
+                miss_positions.append(i)
+                miss_keys.append(key)
+
+        m = len(miss_keys)
+        if m == 0:
+            return results
+
+        # Pack miss fields into a single record array; the Python profile
+        # objects are not touched again after this point.
+        packed = _pack_rows(miss_keys)
+        revenue = packed["revenue"]
+        margin = packed["margin"]
+        cash_flow = packed["cash_flow"]
+        age = packed["age"]
+
+        # Single gather from the precomputed lookup tables
+        sector_risk = SECTOR_RISK_CODE[packed["sector"]]
+        geo_risk = REGION_RISK_CODE[packed["region"]]
+        sector_attractiveness = SECTOR_ATTR[packed["sector"]]
+
+        # Financial scores as ufunc expressions
+        profit_score = np.minimum(margin * 10, 1.0)
+        cash_score = np.minimum(cash_flow / 6, 1.0)
+        revenue_score = np.minimum(revenue / 1000000, 1.0)
+        creditworthiness = profit_score * 0.4 + cash_score * 0.3 + revenue_score * 0.3
+
+        repayment_capacity = np.minimum((revenue * margin) / 12 / 10000, 1.0)
+
+        # Risk pipeline on int codes
+        financial_factors = (cash_flow < 2).astype(np.int8) + (margin < 0.05).astype(np.int8)
+        financial_risk = np.select(
+            [financial_factors >= 2, financial_factors == 1],
+            [RISK_HIGH, RISK_MEDIUM], default=RISK_LOW
         )
-        
-        return {
-            "creditworthiness": creditworthiness,
-            "repayment_capacity": repayment_capacity,
-            "asset_backing": asset_backing,
-            "profit_margin": profit_margin,
-            "cash_flow_months": cash_flow_months
-        }
-    
-    def _analyze_risk_profile(self, profile) -> Dict[str, Any]:
-        """Comprehensive risk assessment"""
-        sector_risk = self._assess_sector_risk(profile.sector)
-        geographic_risk = self._assess_geographic_risk(profile.location)
-        financial_risk = self._assess_financial_risk(profile)
-        
-        overall_risk = self._calculate_overall_risk(sector_risk, geographic_risk, financial_risk)
-        
-        return {
-            "sector_risk": sector_risk,
-            "geographic_risk": geographic_risk,
-            "financial_risk": financial_risk,
-            "overall_risk": overall_risk
-        }
-    
-    def _calculate_funding_readiness(self, demographic, financial, risk) -> float:
-        """Calculate overall funding readiness score (0-1)"""
-        weights = {
-            "financial_health": 0.4,
-            "business_maturity": 0.25,
-            "sector_attractiveness": 0.2,
-            "risk_level": 0.15
-        }
-        
-        financial_score = financial["creditworthiness"]
-        maturity_score = min(demographic["business_age"] / 10, 1.0)
-        sector_score = demographic["sector_attractiveness"]
-        risk_score = 1.0 if risk["overall_risk"] == "low" else 0.7 if risk["overall_risk"] == "medium" else 0.4
-        
-        readiness = (
-            financial_score * weights["financial_health"] +
-            maturity_score * weights["business_maturity"] +
-            sector_score * weights["sector_attractiveness"] +
-            risk_score * weights["risk_level"]
+        avg_risk = (sector_risk + geo_risk + financial_risk) / 3
+        overall_risk_idx = np.select([avg_risk <= 0.5, avg_risk <= 1.5], [RISK_LOW, RISK_MEDIUM], default=RISK_HIGH)
+        risk_score = RISK_SCORE_TABLE[overall_risk_idx]
+
+        # Funding readiness (same weights as the scalar kernel)
+        maturity_score = np.minimum(age / 10, 1.0)
+        funding_readiness = np.clip(
+            creditworthiness * 0.4 +
+            maturity_score * 0.25 +
+            sector_attractiveness * 0.2 +
+            risk_score * 0.15,
+            0.0, 1.0
         )
-        
-        return min(max(readiness, 0.0), 1.0)
-    
-    def _generate_matching_tags(self, profile, demographic) -> List[str]:
+
+        # Materialize intelligence dicts for the misses only
+        for j, key in enumerate(miss_keys):
+            sector, location_lc, profile_age, employees, rev, funding, _, _ = key
+            readiness = float(funding_readiness[j])
+            funding_ratio = funding / max(rev, 1)
+            company_size = self._determine_company_size(employees, rev)
+
+            intelligence = {
+                "business_profile": {
+                    "risk_level": RISK_NAMES[int(overall_risk_idx[j])],
+                    "stage": self._determine_business_stage(profile_age, rev),
+                    "creditworthiness": float(creditworthiness[j]),
+                    "growth_trajectory": "accelerating" if profile_age <= 3 else "stable",
+                    "funding_readiness": readiness,
+                    "sector_attractiveness": float(sector_attractiveness[j])
+                },
+                "funding_indicators": {
+                    "amount_justification": self._assess_amount_justification(funding_ratio),
+                    "repayment_capacity": float(repayment_capacity[j]),
+                    "asset_backing": self._estimate_asset_backing(rev, sector),
+                    "management_strength": 0.75  # Simplified
+                },
+                "matching_tags": self._generate_matching_tags(
+                    sector, location_lc, profile_age, rev, company_size
+                ),
+                "red_flags": self._identify_red_flags(funding_ratio, profile_age),
+                "recommended_funding_types": self._recommend_funding_types(sector, funding, readiness)
+            }
+
+            if len(self._analysis_cache) >= _ANALYSIS_CACHE_SIZE:
+                self._analysis_cache.clear()
+            self._analysis_cache[key] = intelligence
+            results[miss_positions[j]] = intelligence
+
+        logger.info("Batch analysis completed for %d profiles", n)
+        return results
+
+    def _generate_matching_tags(self, sector: str, location_lc: str, age: float,
+                                revenue: float, company_size: str) -> Tuple[str, ...]:
         """Generate tags for funding source matching"""
-        tags = [
-            f"{profile.sector}_business",
-            f"{demographic['company_size']}_enterprise",
-            f"{profile.location.lower()}_location"
-        ]
-        
-        if profile.business_age <= 2:
-            tags.append("startup")
-        elif profile.business_age <= 7:
-            tags.append("growth_stage")
+        if age <= 2:
+            age_tag = "startup"
+        elif age <= 7:
+            age_tag = "growth_stage"
         else:
-            tags.append("established")
-        
-        if profile.annual_revenue > 1000000:
-            tags.append("high_revenue")
-        
+            age_tag = "established"
+
+        key = (sector, company_size, location_lc, age_tag, revenue > 1000000)
+        tags = _TAG_CACHE.get(key)
+        if tags is None:
+            tags = (
+                f"{sector}_business",
+                f"{company_size}_enterprise",
+                f"{location_lc}_location",
+                age_tag
+            )
+            if revenue > 1000000:
+                tags += ("high_revenue",)
+            tags = tuple(sys.intern(tag) for tag in tags)
+            _TAG_CACHE[key] = tags
+
         return tags
     
-    def _identify_red_flags(self, profile) -> List[str]:
+    def _identify_red_flags(self, funding_ratio: float, age: float) -> List[str]:
         """Identify potential deal-breaker issues"""
-        red_flags = []
-        
-        funding_ratio = profile.funding_amount / max(profile.annual_revenue, 1)
-        if funding_ratio > 2.0:
-            red_flags.append("excessive_funding_request")
-        
-        if profile.business_age < 1:
-            red_flags.append("very_new_business")
-        
-        return red_flags
+        mask = (funding_ratio > 2.0) | ((age < 1) << 1)
+        return list(_RED_FLAG_LISTS[mask])
     
-    def _recommend_funding_types(self, profile, readiness) -> List[str]:
+    def _recommend_funding_types(self, sector: str, funding_amount: float, readiness: float) -> List[str]:
         """Recommend optimal funding types"""
-        recommendations = []
+        mask = 0
         
         if readiness >= 0.8:
-            if profile.funding_amount >= 250000:
-                recommendations.extend(["venture_capital", "angel_investment"])
-            recommendations.extend(["bank_loan", "asset_finance"])
+            if funding_amount >= 250000:
+                mask |= _VC_BIT | _ANGEL_BIT
+            mask |= _BANK_BIT | _ASSET_BIT
         elif readiness >= 0.6:
-            recommendations.extend(["bank_loan", "asset_finance", "crowdfunding"])
-            if profile.sector == "technology":
-                recommendations.append("angel_investment")
+            mask |= _BANK_BIT | _ASSET_BIT | _CROWD_BIT
+            if sector == "technology":
+                mask |= _ANGEL_BIT
         else:
-            recommendations.extend(["asset_finance", "crowdfunding", "government_grant"])
+            mask |= _ASSET_BIT | _CROWD_BIT | _GRANT_BIT
         
-        return list(set(recommendations))
+        return [t for i, t in enumerate(FUNDING_TYPE_ORDER) if mask >> i & 1]
     
     # Helper methods
     def _determine_company_size(self, employees: int, revenue: float) -> str:
-        """Determine company size category"""
-        if employees <= 9 and revenue <= 632000:
-            return "micro"
-        elif employees <= 49 and revenue <= 10200000:
-            return "small"
-        elif employees <= 249 and revenue <= 50000000:
-            return "medium"
-        else:
-            return "large"
-    
-    def _calculate_creditworthiness(self, profit_margin: float, cash_flow: int, revenue: float) -> float:
-        """Calculate creditworthiness score"""
-        profit_score = min(profit_margin * 10, 1.0)
-        cash_score = min(cash_flow / 6, 1.0)
-        revenue_score = min(revenue / 1000000, 1.0)
-        
-        return (profit_score * 0.4 + cash_score * 0.3 + revenue_score * 0.3)
-    
-    def _calculate_repayment_capacity(self, revenue: float, margin: float) -> float:
-        """Calculate loan repayment capacity"""
-        annual_profit = revenue * margin
-        monthly_capacity = annual_profit / 12
-        return min(monthly_capacity / 10000, 1.0)
+        """Determine company size category via branchless threshold counts"""
+        employee_code = (employees > 9) + (employees > 49) + (employees > 249)
+        revenue_code = (revenue > 632000) + (revenue > 10200000) + (revenue > 50000000)
+        return COMPANY_SIZE_NAMES[max(employee_code, revenue_code)]
     
     def _estimate_asset_backing(self, revenue: float, sector: str) -> float:
         """Estimate asset backing strength"""
@@ -239,21 +434,8 @@ class BusinessAnalyzer:
         
         return min(base_ratio, 1.0)
     
-    def _calculate_sector_attractiveness(self, sector_info: Dict) -> float:
-        """Calculate sector attractiveness for funding"""
-        growth_potential = sector_info.get("growth_potential", "medium")
-        risk_level = sector_info.get("risk_level", "medium")
-        
-        growth_score = {"high": 0.8, "medium": 0.6, "low": 0.4}.get(growth_potential, 0.5)
-        risk_score = {"low": 0.8, "medium": 0.6, "high": 0.3}.get(risk_level, 0.5)
-        
-        return (growth_score + risk_score) / 2
-    
-    def _determine_business_stage(self, profile) -> str:
+    def _determine_business_stage(self, age: float, revenue: float) -> str:
         """Determine business development stage"""
-        age = profile.business_age
-        revenue = profile.annual_revenue
-        
         if age <= 2 and revenue < 500000:
             return "startup"
         elif age <= 7 or revenue < 2000000:
@@ -261,10 +443,8 @@ class BusinessAnalyzer:
         else:
             return "mature"
     
-    def _assess_amount_justification(self, profile) -> str:
+    def _assess_amount_justification(self, funding_ratio: float) -> str:
         """Assess if funding amount is reasonable"""
-        funding_ratio = profile.funding_amount / max(profile.annual_revenue, 1)
-        
         if funding_ratio <= 0.5:
             return "conservative"
         elif funding_ratio <= 1.0:
@@ -274,31 +454,8 @@ class BusinessAnalyzer:
         else:
             return "excessive"
     
-    def _assess_sector_risk(self, sector: str) -> str:
-        """Assess sector-specific risk"""
-        return self.sector_data.get(sector, {}).get("risk_level", "medium")
-    
-    def _assess_geographic_risk(self, location: str) -> str:
-        """Assess geographic risk"""
-        region_data = self.regional_data.get(location.lower(), {})
-        business_density = region_data.get("business_density", "medium")
-        
-        risk_mapping = {
-            "very_high": "low",
-            "high": "low",
-            "medium": "medium", 
-            "low": "high"
-        }
-        
-        return risk_mapping.get(business_density, "medium")
-    
-    def _assess_financial_risk(self, profile) -> str:
-        """Assess financial risk"""
-        financials = profile.financials or {}
-        
-        cash_flow = financials.get("cash_flow_months", 2)
-        profit_margin = financials.get("profit_margin", 0.05)
-        
+    def _assess_financial_risk(self, profit_margin: float, cash_flow: float) -> int:
+        """Assess financial risk as an int code (RISK_LOW/MEDIUM/HIGH)"""
         risk_factors = 0
         if cash_flow < 2:
             risk_factors += 1
@@ -306,52 +463,15 @@ class BusinessAnalyzer:
             risk_factors += 1
         
         if risk_factors >= 2:
-            return "high"
+            return RISK_HIGH
         elif risk_factors == 1:
-            return "medium"
-        else:
-            return "low"
-    
-    def _calculate_overall_risk(self, sector: str, geographic: str, financial: str) -> str:
-        """Calculate overall risk profile"""
-        risk_scores = {"low": 1, "medium": 2, "high": 3}
-        
-        total_score = (
-            risk_scores[sector] +
-            risk_scores[geographic] +
-            risk_scores[financial]
-        )
-        
-        avg_score = total_score / 3
-        
-        if avg_score <= 1.5:
-            return "low"
-        elif avg_score <= 2.5:
-            return "medium"
+            return RISK_MEDIUM
         else:
-            return "high"
-    
+            return RISK_LOW
+
     def _create_fallback_analysis(self, profile) -> Dict[str, Any]:
         """Create minimal analysis if main analysis fails"""
-        return {
-            "business_profile": {
-                "risk_level": "medium",
-                "stage": "unknown",
-                "creditworthiness": 0.5,
-                "growth_trajectory": "stable",
-                "funding_readiness": 0.4,
-                "sector_attractiveness": 0.5
-            },
-            "funding_indicators": {
-                "amount_justification": "unknown",
-                "repayment_capacity": 0.5,
-                "asset_backing": 0.3,
-                "management_strength": 0.5
-            },
-            "matching_tags": [profile.sector, "fallback_analysis"],
-            "red_flags": ["incomplete_data"],
-            "recommended_funding_types": ["asset_finance", "crowdfunding"]
-        }
+        return {**_FALLBACK_TEMPLATE, "matching_tags": [profile.sector, "fallback_analysis"]}
 
 # Example usage
 if __name__ == "__main__":
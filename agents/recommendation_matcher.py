@@ -8,31 +8,116 @@ Recommendation Matcher Agent for the Capital Recommender System.
 Executes sophisticated matching logic using multi-dimensional scoring algorithms.
 """
 
+import copy
 import math
 import logging
+from collections import OrderedDict
 from typing import Dict, List, Any, Tuple
-from dataclasses import dataclass
 
-from config import SCORING_WEIGHTS, FUNDING_TYPES, CONFIG
+import numpy as np
+
+from config import (
+    SCORING_WEIGHTS, FUNDING_TYPES, CONFIG, UK_SECTORS, UK_REGIONS,
+    SECTOR_CODE, REGION_CODE
+)
 
 logger = logging.getLogger(__name__)
 
-@dataclass
-class MatchResult:
-    """Individual funding source match result"""
-    source_id: str
-    source_name: str
-    funding_type: str
-    overall_score: float
-    score_breakdown: Dict[str, float]
-    success_probability: float
-    amount_range: str
-    timeline: str
-    broker_commission: str
-    requirements: List[str]
-    contact: Dict[str, str]
-    next_steps: List[str]
-    reasoning: str
+# Funding types and stages as int codes; the trailing slot is the unknown default
+FUNDING_TYPE_CODES = {
+    "bank_loan": 0,
+    "asset_finance": 1,
+    "angel_investment": 2,
+    "venture_capital": 3,
+    "crowdfunding": 4,
+    "government_grant": 5,
+    "family_office": 6
+}
+TYPE_UNKNOWN = len(FUNDING_TYPE_CODES)
+
+STAGE_CODES = {"startup": 0, "growth": 1, "mature": 2}
+STAGE_UNKNOWN = len(STAGE_CODES)
+
+# Per-type lookup tables indexed by the codes above (columns: stage codes)
+_STAGE_PREF_LUT = np.array([
+    [0.4, 0.8, 1.0, 0.5],  # bank_loan
+    [0.6, 0.9, 1.0, 0.5],  # asset_finance
+    [1.0, 0.7, 0.3, 0.5],  # angel_investment
+    [0.9, 1.0, 0.2, 0.5],  # venture_capital
+    [0.8, 0.9, 0.5, 0.5],  # crowdfunding
+    [0.9, 0.8, 0.6, 0.5],  # government_grant
+    [0.6, 1.0, 0.8, 0.5],  # family_office
+    [0.5, 0.5, 0.5, 0.5],  # unknown type
+])
+_BASE_SUCCESS_LUT = np.array([0.65, 0.75, 0.25, 0.15, 0.45, 0.35, 0.40, 0.5])
+_COMPLEXITY_LUT = np.array([0.7, 0.9, 0.5, 0.3, 0.6, 0.4, 0.4, 0.5])
+_LONGTERM_LUT = np.array([0.6, 0.6, 0.9, 0.9, 0.4, 0.4, 0.9, 0.4])
+_FOLLOWON_LUT = np.array([0.3, 0.3, 0.8, 0.8, 0.3, 0.3, 0.7, 0.3])
+# Equity investors weigh management directly; strong-network types for network benefits
+_EQUITY_MGMT_LUT = np.array([False, False, True, True, False, False, False, False])
+_STRONG_NETWORK_LUT = np.array([False, False, True, True, False, False, True, False])
+
+_APPETITE_SCORES = {
+    "aggressive": 1.0,
+    "neutral": 0.7,
+    "selective": 0.5,
+    "cautious": 0.3,
+    "limited": 0.1
+}
+_MARKET_STATUS_SCORES = {"hot": 1.0, "neutral": 0.7, "cold": 0.4}
+_REPUTATION_BY_NAME = (
+    ("Barclays", 0.9),
+    ("Lloyds", 0.9),
+    ("Seedcamp", 0.8),
+    ("Crowdcube", 0.7)
+)
+
+_SCORE_KEYS = (
+    "overall_score", "compatibility", "approval_probability",
+    "commercial_value", "strategic_fit"
+)
+
+# Sub-score weights per dimension, applied as (N,K) @ (K,) dot products
+_COMPATIBILITY_WEIGHTS = np.array([0.25, 0.25, 0.20, 0.20, 0.10])
+_PROBABILITY_WEIGHTS = np.array([0.30, 0.25, 0.25, 0.10, 0.10])
+_COMMERCIAL_WEIGHTS = np.array([0.40, 0.30, 0.20, 0.10])
+_STRATEGIC_WEIGHTS = np.array([0.40, 0.20, 0.20, 0.10, 0.10])
+
+_RESULT_CACHE_SIZE = 128
+
+# Document-preparation steps shared by all sources of a funding type
+_NEXT_STEPS_BY_TYPE = {
+    "bank_loan": (
+        "Prepare 3 years of audited accounts",
+        "Gather recent bank statements",
+        "Complete business plan summary"
+    ),
+    "asset_finance": (
+        "Prepare 3 years of audited accounts",
+        "Gather recent bank statements",
+        "Complete business plan summary"
+    ),
+    "venture_capital": (
+        "Prepare investor pitch deck",
+        "Document growth strategy",
+        "Prepare financial projections"
+    ),
+    "angel_investment": (
+        "Prepare investor pitch deck",
+        "Document growth strategy",
+        "Prepare financial projections"
+    ),
+    "government_grant": (
+        "Review eligibility criteria in detail",
+        "Prepare innovation/project plan",
+        "Complete online application"
+    )
+}
+
+# Sector/region vocabularies as bit positions for membership bitmasks;
+# values outside the vocabulary fall back to the per-source Python tests
+_SECTOR_CODE = SECTOR_CODE
+_REGION_CODE = REGION_CODE
 
 class RecommendationMatcher:
     """
@@ -45,6 +130,28 @@ class RecommendationMatcher:
         self.funding_type_data = FUNDING_TYPES
         self.min_score_threshold = CONFIG.MIN_MATCH_SCORE
         self.max_recommendations = CONFIG.MAX_RECOMMENDATIONS
+        self._dimension_weights = np.array([
+            SCORING_WEIGHTS["compatibility"],
+            SCORING_WEIGHTS["approval_probability"],
+            SCORING_WEIGHTS["commercial_value"],
+            SCORING_WEIGHTS["strategic_fit"]
+        ])
+        self._result_cache: "OrderedDict[tuple, List[Dict]]" = OrderedDict()
+        # Statistics are pure config; build the template once
+        self._stats_template = {
+            "scoring_framework": {
+                "dimensions": 4,
+                "weights": self.scoring_weights,
+                "min_threshold": self.min_score_threshold
+            },
+            "quality_controls": {
+                "max_recommendations": self.max_recommendations,
+                "diversity_requirement": CONFIG.DIVERSITY_REQUIREMENT,
+                "confidence_threshold": CONFIG.CONFIDENCE_THRESHOLD
+            },
+            "algorithm_version": "1.0.0",
+            "last_updated": "2025-09-06"
+        }
         
         logger.info("Recommendation Matcher initialized")
     
@@ -62,405 +169,312 @@ class RecommendationMatcher:
             List of ranked match results with detailed scoring
         """
         try:
-            logger.info(f"Generating matches for {len(funding_sources)} funding sources")
-            
-            matches = []
-            
-            for source in funding_sources:
-                # Calculate multi-dimensional match score
-                match_score = self._calculate_match_score(
-                    business_intelligence, source, business_profile
-                )
-                
-                # Only include matches above threshold
-                if match_score["overall_score"] >= self.min_score_threshold:
-                    # Create detailed match result
-                    match_result = self._create_match_result(
-                        source, match_score, business_intelligence, business_profile
-                    )
-                    matches.append(match_result)
+            logger.info("Generating matches for %d funding sources", len(funding_sources))
             
-            # Sort by overall score and apply diversity rules
-            ranked_matches = self._rank_and_diversify_matches(matches)
-            
-            # Limit to maximum recommendations
-            final_matches = ranked_matches[:self.max_recommendations]
+            if not funding_sources:
+                return []
+
+            # Repeat queries with unchanged inputs skip the whole pipeline
+            cache_key = self._cache_key(business_intelligence, funding_sources, business_profile)
+            cached = self._result_cache.get(cache_key)
+            if cached is not None:
+                self._result_cache.move_to_end(cache_key)
+                return copy.deepcopy(cached)
+
+            # Score every source in one vectorized pass
+            overall, compatibility, probability, commercial, strategic = self._score_sources(
+                business_intelligence, funding_sources, business_profile
+            )
+
+            # Rank and diversify on the score arrays; only the final picks
+            # get materialized into full match results
+            selected = self._select_top_matches(overall, funding_sources)
+
+            final_matches = []
+            for i in selected:
+                match_score = {
+                    "overall_score": float(overall[i]),
+                    "compatibility": float(compatibility[i]),
+                    "approval_probability": float(probability[i]),
+                    "commercial_value": float(commercial[i]),
+                    "strategic_fit": float(strategic[i])
+                }
+                final_matches.append(self._create_match_result(
+                    funding_sources[i], match_score, business_intelligence, business_profile
+                ))
             
-            logger.info(f"Generated {len(final_matches)} qualified recommendations")
-            return [self._match_result_to_dict(match) for match in final_matches]
+            self._result_cache[cache_key] = copy.deepcopy(final_matches)
+            if len(self._result_cache) > _RESULT_CACHE_SIZE:
+                self._result_cache.popitem(last=False)
+
+            logger.info("Generated %d qualified recommendations", len(final_matches))
+            return final_matches
             
         except Exception as e:
-            logger.error(f"Error generating matches: {str(e)}")
+            logger.error("Error generating matches: %s", e)
             return self._create_fallback_matches(business_profile)
     
-    def _calculate_match_score(self, intelligence: Dict, source: Dict, profile) -> Dict[str, float]:
-        """
-        Calculate comprehensive match score using 4-dimensional framework:
-        1. Compatibility (40%) - Sector, stage, geography, amount alignment
-        2. Approval Probability (35%) - Historical success, appetite, financial health
-        3. Commercial Value (15%) - Broker commission, processing efficiency
-        4. Strategic Fit (10%) - Long-term potential, reputation, network effects
-        """
-        
-        # Calculate individual dimension scores
-        compatibility = self._calculate_compatibility_score(intelligence, source, profile)
-        probability = self._calculate_approval_probability(intelligence, source, profile)
-        commercial = self._calculate_commercial_value(source, profile)
-        strategic = self._calculate_strategic_fit(intelligence, source, profile)
-        
-        # Apply weights and calculate overall score
-        overall_score = (
-            compatibility * self.scoring_weights["compatibility"] +
-            probability * self.scoring_weights["approval_probability"] +
-            commercial * self.scoring_weights["commercial_value"] +
-            strategic * self.scoring_weights["strategic_fit"]
+    @staticmethod
+    def _cache_key(intelligence: Dict, sources: List[Dict], profile) -> tuple:
+        """Key covering every input the scoring pipeline reads"""
+        business = intelligence["business_profile"]
+        indicators = intelligence["funding_indicators"]
+        return (
+            profile.sector, profile.location, profile.funding_amount,
+            business["stage"], business["funding_readiness"], business["creditworthiness"],
+            indicators["repayment_capacity"], indicators["management_strength"],
+            tuple(
+                (s.get("source_id"), s.get("current_appetite"),
+                 s.get("sector_market_status"), s.get("market_adjusted_timeline"))
+                for s in sources
+            )
         )
-        
-        return {
-            "overall_score": min(overall_score, 1.0),
-            "compatibility": compatibility,
-            "approval_probability": probability,
-            "commercial_value": commercial,
-            "strategic_fit": strategic
-        }
-    
-    def _calculate_compatibility_score(self, intelligence: Dict, source: Dict, profile) -> float:
-        """Calculate compatibility between business and funding source"""
-        score = 0.0
-        
-        # Sector alignment (25% of compatibility)
-        sector_score = self._assess_sector_compatibility(source, profile.sector)
-        score += sector_score * 0.25
-        
-        # Business stage vs funding stage preference (25%)
-        stage_score = self._assess_stage_compatibility(intelligence, source, profile)
-        score += stage_score * 0.25
-        
-        # Geographic coverage and focus (20%)
-        geo_score = self._assess_geographic_compatibility(source, profile.location)
-        score += geo_score * 0.20
-        
-        # Amount range compatibility (20%)
-        amount_score = self._assess_amount_compatibility(source, profile.funding_amount)
-        score += amount_score * 0.20
-        
-        # Regulatory compliance matching (10%)
-        compliance_score = self._assess_compliance_compatibility(source, profile)
-        score += compliance_score * 0.10
-        
-        return min(score, 1.0)
-    
-    def _calculate_approval_probability(self, intelligence: Dict, source: Dict, profile) -> float:
-        """Calculate likelihood of approval based on historical and current factors"""
-        score = 0.0
-        
-        # Historical success rates for similar profiles (30%)
-        historical_score = self._assess_historical_success_rate(intelligence, source)
-        score += historical_score * 0.30
-        
-        # Current lending/investment appetite (25%)
-        appetite_score = self._assess_current_appetite(source)
-        score += appetite_score * 0.25
-        
-        # Credit and financial health alignment (25%)
-        financial_score = self._assess_financial_alignment(intelligence, source)
-        score += financial_score * 0.25
-        
-        # Management team strength match (10%)
-        management_score = self._assess_management_fit(intelligence, source)
-        score += management_score * 0.10
-        
-        # Market condition favorability (10%)
-        market_score = self._assess_market_conditions(source)
-        score += market_score * 0.10
-        
-        return min(score, 1.0)
-    
-    def _calculate_commercial_value(self, source: Dict, profile) -> float:
-        """Calculate commercial value for broker"""
-        score = 0.0
-        
-        # Broker commission potential (40%)
-        commission_score = self._assess_commission_potential(source, profile)
-        score += commission_score * 0.40
-        
-        # Processing speed and efficiency (30%)
-        efficiency_score = self._assess_processing_efficiency(source)
-        score += efficiency_score * 0.30
-        
-        # Relationship manager quality (20%)
-        relationship_score = self._assess_relationship_quality(source)
-        score += relationship_score * 0.20
-        
-        # Application complexity level (10%)
-        complexity_score = self._assess_application_complexity(source)
-        score += complexity_score * 0.10
-        
-        return min(score, 1.0)
-    
-    def _calculate_strategic_fit(self, intelligence: Dict, source: Dict, profile) -> float:
-        """Calculate strategic fit and long-term value"""
-        score = 0.0
-        
-        # Long-term relationship potential (40%)
-        relationship_score = self._assess_longterm_potential(intelligence, source)
-        score += relationship_score * 0.40
-        
-        # Portfolio diversification value (20%)
-        diversification_score = self._assess_portfolio_fit(source, profile)
-        score += diversification_score * 0.20
-        
-        # Market reputation and credibility (20%)
-        reputation_score = self._assess_reputation_value(source)
-        score += reputation_score * 0.20
-        
-        # Follow-on funding opportunities (10%)
-        followon_score = self._assess_followon_potential(source, profile)
-        score += followon_score * 0.10
-        
-        # Network effect benefits (10%)
-        network_score = self._assess_network_benefits(source, profile)
-        score += network_score * 0.10
-        
-        return min(score, 1.0)
-    
-    # Individual assessment methods
-    def _assess_sector_compatibility(self, source: Dict, sector: str) -> float:
-        """Assess sector compatibility"""
-        source_sectors = source.get("sectors", [])
-        excluded_sectors = source.get("excluded_sectors", [])
-        
-        if sector in excluded_sectors:
-            return 0.0
-        elif source_sectors == ["all"] or sector in source_sectors:
-            return 1.0
-        else:
-            return 0.3  # Some flexibility for related sectors
-    
-    def _assess_stage_compatibility(self, intelligence: Dict, source: Dict, profile) -> float:
-        """Assess business stage compatibility"""
-        business_stage = intelligence["business_profile"]["stage"]
-        source_type = source["type"]
-        
-        # Stage preference mapping
-        stage_preferences = {
-            "bank_loan": {"mature": 1.0, "growth": 0.8, "startup": 0.4},
-            "asset_finance": {"mature": 1.0, "growth": 0.9, "startup": 0.6},
-            "angel_investment": {"startup": 1.0, "growth": 0.7, "mature": 0.3},
-            "venture_capital": {"startup": 0.9, "growth": 1.0, "mature": 0.2},
-            "crowdfunding": {"startup": 0.8, "growth": 0.9, "mature": 0.5},
-            "government_grant": {"startup": 0.9, "growth": 0.8, "mature": 0.6},
-            "family_office": {"growth": 1.0, "mature": 0.8, "startup": 0.6}
-        }
-        
-        preferences = stage_preferences.get(source_type, {})
-        return preferences.get(business_stage, 0.5)
-    
-    def _assess_geographic_compatibility(self, source: Dict, location: str) -> float:
-        """Assess geographic compatibility"""
-        geo_requirements = source.get("geographic_requirement", [])
-        
-        if not geo_requirements:  # UK-wide
-            return 1.0
-        elif location.lower() in geo_requirements:
-            return 1.0
-        else:
-            return 0.0
-    
-    def _assess_amount_compatibility(self, source: Dict, amount: float) -> float:
-        """Assess funding amount compatibility"""
-        min_amount = source["amount_range"]["min"]
-        max_amount = source["amount_range"]["max"]
-        
-        if min_amount <= amount <= max_amount:
-            # Perfect fit in middle 50% of range
-            mid_point = (min_amount + max_amount) / 2
-            range_size = max_amount - min_amount
-            
-            if abs(amount - mid_point) <= (range_size * 0.25):
-                return 1.0
-            else:
-                return 0.8
-        else:
-            return 0.0
-    
-    def _assess_compliance_compatibility(self, source: Dict, profile) -> float:
-        """Assess regulatory compliance alignment"""
-        # Simple assessment - in real system would check detailed compliance
-        return 0.9  # Assume generally compliant
-    
-    def _assess_historical_success_rate(self, intelligence: Dict, source: Dict) -> float:
-        """Assess historical success rate for similar profiles"""
-        # Simulate historical success based on source type and business profile
-        base_rates = {
-            "bank_loan": 0.65,
-            "asset_finance": 0.75,
-            "angel_investment": 0.25,
-            "venture_capital": 0.15,
-            "crowdfunding": 0.45,
-            "government_grant": 0.35,
-            "family_office": 0.40
-        }
-        
-        base_rate = base_rates.get(source["type"], 0.5)
-        
-        # Adjust based on business intelligence
-        readiness = intelligence["business_profile"]["funding_readiness"]
-        creditworthiness = intelligence["business_profile"]["creditworthiness"]
-        
-        adjusted_rate = base_rate * (0.5 + 0.5 * readiness) * (0.5 + 0.5 * creditworthiness)
-        
-        return min(adjusted_rate, 1.0)
-    
-    def _assess_current_appetite(self, source: Dict) -> float:
-        """Assess current lending/investment appetite"""
-        appetite_scores = {
-            "aggressive": 1.0,
-            "neutral": 0.7,
-            "selective": 0.5,
-            "cautious": 0.3,
-            "limited": 0.1
-        }
-        
-        appetite = source.get("current_appetite", "neutral")
-        return appetite_scores.get(appetite, 0.5)
-    
-    def _assess_financial_alignment(self, intelligence: Dict, source: Dict) -> float:
-        """Assess financial health alignment"""
-        creditworthiness = intelligence["business_profile"]["creditworthiness"]
-        repayment_capacity = intelligence["funding_indicators"]["repayment_capacity"]
-        
-        # Weight creditworthiness and repayment capacity
-        return (creditworthiness * 0.6 + repayment_capacity * 0.4)
-    
-    def _assess_management_fit(self, intelligence: Dict, source: Dict) -> float:
-        """Assess management team alignment"""
-        management_strength = intelligence["funding_indicators"]["management_strength"]
-        
-        # Different funding types have different management requirements
-        if source["type"] in ["venture_capital", "angel_investment"]:
-            return management_strength
+
+    def invalidate(self) -> None:
+        """Drop cached results (call when the source universe changes)"""
+        self._result_cache.clear()
+
+    # Static per-source column order for the scoring arrays
+    # (type_code, relationship, reputation, efficiency, avg_commission,
+    #  amt_min, amt_max). Appetite and market status are deliberately NOT
+    # cached here: refresh_market_data rewrites them, so they are read
+    # per call.
+
+    @staticmethod
+    def _source_static_cols(source: Dict) -> tuple:
+        """Truly static scoring inputs, computed once per source dict"""
+        cols = source.get("_match_cols")
+        if cols is not None:
+            return cols
+
+        type_code = FUNDING_TYPE_CODES.get(source.get("type"), TYPE_UNKNOWN)
+
+        # Relationship manager quality
+        if source.get("availability_status") == "relationship_based":
+            relationship = 0.9
+        elif source.get("type") in ("family_office", "venture_capital"):
+            relationship = 0.8
         else:
-            return 0.7 + (management_strength * 0.3)  # Less critical for traditional funding
-    
-    def _assess_market_conditions(self, source: Dict) -> float:
-        """Assess market condition favorability"""
-        sector_status = source.get("sector_market_status", "neutral")
-        
-        status_scores = {
-            "hot": 1.0,
-            "neutral": 0.7,
-            "cold": 0.4
-        }
-        
-        return status_scores.get(sector_status, 0.7)
-    
-    def _assess_commission_potential(self, source: Dict, profile) -> float:
-        """Assess broker commission potential"""
-        commission = source.get("broker_commission", {})
-        
-        if isinstance(commission, dict):
-            avg_commission = (commission.get("min", 0) + commission.get("max", 0)) / 2
-            potential_revenue = (avg_commission / 100) * profile.funding_amount
-            
-            # Normalize to 0-1 scale (£10k commission = 1.0)
-            return min(potential_revenue / 10000, 1.0)
-        
-        return 0.5
-    
-    def _assess_processing_efficiency(self, source: Dict) -> float:
-        """Assess processing speed and efficiency"""
+            relationship = 0.6
+
+        # Market reputation by name
+        source_name = source.get("name", "")
+        reputation = 0.6
+        for name, score in _REPUTATION_BY_NAME:
+            if name in source_name:
+                reputation = score
+                break
+
+        # Processing efficiency from the approval timeline (faster = better)
         timeline = source.get("approval_timeline", "4-8 weeks")
-        
-        # Extract weeks from timeline string
+        efficiency = 0.5
         if "week" in timeline:
             weeks_parts = timeline.split("-")
             try:
                 max_weeks = int(weeks_parts[1].split()[0])
-                # Faster = better (inverse relationship)
-                return max(0.1, 1.0 - (max_weeks - 1) / 20)
+                efficiency = max(0.1, 1.0 - (max_weeks - 1) / 20)
             except (ValueError, IndexError):
-                return 0.5
-        
-        return 0.5
-    
-    def _assess_relationship_quality(self, source: Dict) -> float:
-        """Assess relationship manager quality"""
-        # Simulate based on source type and status
-        if source.get("availability_status") == "relationship_based":
-            return 0.9  # High touch relationship
-        elif source["type"] in ["family_office", "venture_capital"]:
-            return 0.8  # Generally good relationships
-        else:
-            return 0.6  # Standard relationship quality
-    
-    def _assess_application_complexity(self, source: Dict) -> float:
-        """Assess application complexity (lower complexity = higher score)"""
-        complexity_by_type = {
-            "asset_finance": 0.9,  # Simple, asset-backed
-            "bank_loan": 0.7,     # Standard process
-            "crowdfunding": 0.6,   # Marketing intensive
-            "government_grant": 0.4,  # Complex application
-            "venture_capital": 0.3,   # Very complex
-            "angel_investment": 0.5,  # Moderate complexity
-            "family_office": 0.4     # Relationship dependent
-        }
-        
-        return complexity_by_type.get(source["type"], 0.5)
-    
-    def _assess_longterm_potential(self, intelligence: Dict, source: Dict) -> float:
-        """Assess long-term relationship potential"""
-        if source["type"] in ["venture_capital", "family_office", "angel_investment"]:
-            # Equity partners - high long-term potential
-            return 0.9
-        elif source["type"] in ["bank_loan", "asset_finance"]:
-            # Lending relationships can develop over time
-            return 0.6
-        else:
-            return 0.4
-    
-    def _assess_portfolio_fit(self, source: Dict, profile) -> float:
-        """Assess portfolio diversification value"""
-        # Simulate based on broker's portfolio needs
-        return 0.7  # Assume most deals add portfolio value
-    
-    def _assess_reputation_value(self, source: Dict) -> float:
-        """Assess market reputation and credibility"""
-        reputation_by_name = {
-            "Barclays": 0.9,
-            "Lloyds": 0.9,
-            "Seedcamp": 0.8,
-            "Crowdcube": 0.7
-        }
-        
-        source_name = source.get("name", "")
-        for name, score in reputation_by_name.items():
-            if name in source_name:
-                return score
-        
-        return 0.6  # Default reputation score
-    
-    def _assess_followon_potential(self, source: Dict, profile) -> float:
-        """Assess follow-on funding opportunities"""
-        if source["type"] in ["venture_capital", "angel_investment"]:
-            return 0.8  # High follow-on potential
-        elif source["type"] == "family_office":
-            return 0.7
+                pass
+
+        commission = source.get("broker_commission", {})
+        if isinstance(commission, dict):
+            avg_commission = (commission.get("min", 0) + commission.get("max", 0)) / 2
         else:
-            return 0.3  # Limited follow-on for debt
-    
-    def _assess_network_benefits(self, source: Dict, profile) -> float:
-        """Assess network effect benefits"""
-        if source["type"] in ["venture_capital", "angel_investment", "family_office"]:
-            return 0.8  # Strong networks
-        elif profile.sector == "technology":
-            return 0.6  # Tech sector has good networks
+            avg_commission = -1.0  # Sentinel: commission structure unknown
+
+        amount_range = source.get("amount_range", {})
+        cols = (
+            float(type_code), relationship, reputation, efficiency,
+            avg_commission, amount_range.get("min", 0), amount_range.get("max", 0)
+        )
+        source["_match_cols"] = cols
+        return cols
+
+    @staticmethod
+    def _source_mask_cols(source: Dict) -> tuple:
+        """Sector/geo membership packed into bitmasks, once per source dict.
+
+        Columns: sector mask, excluded mask, all-sectors flag, geo mask,
+        uk-wide flag. Sectors outside the vocabulary simply stay out of
+        the masks; profiles naming them take the fallback path instead.
+        """
+        masks = source.get("_mask_cols")
+        if masks is not None:
+            return masks
+
+        sectors = source.get("sectors", [])
+        sector_mask = 0
+        for name in sectors:
+            code = _SECTOR_CODE.get(name)
+            if code is not None:
+                sector_mask |= 1 << code
+        excluded_mask = 0
+        for name in source.get("excluded_sectors", []):
+            code = _SECTOR_CODE.get(name)
+            if code is not None:
+                excluded_mask |= 1 << code
+
+        geo_req = source.get("geographic_requirement", [])
+        geo_mask = 0
+        for name in geo_req:
+            code = _REGION_CODE.get(name)
+            if code is not None:
+                geo_mask |= 1 << code
+
+        masks = (sector_mask, excluded_mask, int(sectors == ["all"]), geo_mask, int(not geo_req))
+        source["_mask_cols"] = masks
+        return masks
+
+    def _score_sources(self, intelligence: Dict, sources: List[Dict],
+                       profile) -> Tuple[np.ndarray, ...]:
+        """
+        Score all sources at once using the 4-dimensional framework:
+        1. Compatibility (40%) - Sector, stage, geography, amount alignment
+        2. Approval Probability (35%) - Historical success, appetite, financial health
+        3. Commercial Value (15%) - Broker commission, processing efficiency
+        4. Strategic Fit (10%) - Long-term potential, reputation, network effects
+
+        Sources are laid out as structure-of-arrays: static columns are
+        cached per source dict and the profile-dependent pieces are built
+        per call, so every dimension reduces to whole-array expressions.
+        """
+        n = len(sources)
+        static = np.array([self._source_static_cols(s) for s in sources])
+        type_code = static[:, 0].astype(np.intp)
+        relationship = static[:, 1]
+        reputation = static[:, 2]
+        efficiency = static[:, 3]
+        avg_commission = static[:, 4]
+        amt_min = static[:, 5]
+        amt_max = static[:, 6]
+
+        # Volatile per-source state: refresh_market_data rewrites these on
+        # its copy-on-write snapshots, so read them fresh every call
+        appetite = np.fromiter(
+            (_APPETITE_SCORES.get(s.get("current_appetite", "neutral"), 0.5)
+             for s in sources),
+            dtype=float, count=n
+        )
+        market = np.fromiter(
+            (_MARKET_STATUS_SCORES.get(s.get("sector_market_status", "neutral"), 0.7)
+             for s in sources),
+            dtype=float, count=n
+        )
+
+        # Business intelligence scalars, read once for all sources
+        business = intelligence["business_profile"]
+        indicators = intelligence["funding_indicators"]
+        stage_code = STAGE_CODES.get(business["stage"], STAGE_UNKNOWN)
+        readiness = business["funding_readiness"]
+        creditworthiness = business["creditworthiness"]
+        repayment_capacity = indicators["repayment_capacity"]
+        management_strength = indicators["management_strength"]
+
+        sector = profile.sector
+        location = profile.location.lower()
+        amount = profile.funding_amount
+
+        # Profile-dependent membership as bit tests on the packed masks
+        sector_code = _SECTOR_CODE.get(sector)
+        region_code = _REGION_CODE.get(location)
+        if sector_code is not None and region_code is not None:
+            masks = np.array([self._source_mask_cols(s) for s in sources], dtype=np.uint64)
+            sector_bit = np.uint64(1 << sector_code)
+            excluded = (masks[:, 1] & sector_bit) != 0
+            allowed = (masks[:, 2] != 0) | ((masks[:, 0] & sector_bit) != 0)
+            sector_score = np.where(excluded, 0.0, np.where(allowed, 1.0, 0.3))
+            region_bit = np.uint64(1 << region_code)
+            geo_score = ((masks[:, 4] != 0) | ((masks[:, 3] & region_bit) != 0)).astype(float)
         else:
-            return 0.4
+            # Sector or region outside the vocabulary: test memberships directly
+            sector_score = np.fromiter(
+                (0.0 if sector in s.get("excluded_sectors", ())
+                 else 1.0 if s.get("sectors") == ["all"] or sector in s.get("sectors", ())
+                 else 0.3
+                 for s in sources),
+                dtype=float, count=n
+            )
+            geo_score = np.fromiter(
+                (1.0 if not s.get("geographic_requirement")
+                 or location in s["geographic_requirement"] else 0.0
+                 for s in sources),
+                dtype=float, count=n
+            )
+
+        # Amount fit: 1.0 in the middle 50% of the range, 0.8 elsewhere inside
+        # it, 0.0 outside — written branchless over the two boolean masks
+        mid_point = (amt_min + amt_max) / 2
+        in_range = (amt_min <= amount) & (amount <= amt_max)
+        tight_fit = np.abs(amount - mid_point) <= (amt_max - amt_min) * 0.25
+        amount_score = in_range * (0.8 + 0.2 * tight_fit)
+
+        # Compatibility: sector, stage, geography, amount, compliance
+        compliance = np.full(n, 0.9)  # Compliance assumed in this simulation
+        compatibility = np.minimum(
+            np.stack([
+                sector_score, _STAGE_PREF_LUT[type_code, stage_code],
+                geo_score, amount_score, compliance
+            ], axis=1) @ _COMPATIBILITY_WEIGHTS,
+            1.0
+        )
+
+        # Approval probability: history, appetite, financials, management, market
+        historical = np.minimum(
+            _BASE_SUCCESS_LUT[type_code]
+            * (0.5 + 0.5 * readiness) * (0.5 + 0.5 * creditworthiness),
+            1.0
+        )
+        financial = creditworthiness * 0.6 + repayment_capacity * 0.4
+        management = np.where(
+            _EQUITY_MGMT_LUT[type_code],
+            management_strength,
+            0.7 + management_strength * 0.3  # Less critical for traditional funding
+        )
+        probability = np.minimum(
+            np.stack([
+                historical, appetite, np.full(n, financial), management, market
+            ], axis=1) @ _PROBABILITY_WEIGHTS,
+            1.0
+        )
+
+        # Commercial value: commission, efficiency, relationship, complexity
+        commission_score = np.where(
+            avg_commission >= 0,
+            np.minimum((avg_commission / 100) * amount / 10000, 1.0),
+            0.5
+        )
+        commercial = np.minimum(
+            np.stack([
+                commission_score, efficiency, relationship, _COMPLEXITY_LUT[type_code]
+            ], axis=1) @ _COMMERCIAL_WEIGHTS,
+            1.0
+        )
+
+        # Strategic fit: long-term, portfolio, reputation, follow-on, network
+        network = np.where(
+            _STRONG_NETWORK_LUT[type_code],
+            0.8,
+            0.6 if sector == "technology" else 0.4
+        )
+        portfolio = np.full(n, 0.7)  # Portfolio diversification assumed valuable
+        strategic = np.minimum(
+            np.stack([
+                _LONGTERM_LUT[type_code], portfolio, reputation,
+                _FOLLOWON_LUT[type_code], network
+            ], axis=1) @ _STRATEGIC_WEIGHTS,
+            1.0
+        )
+
+        overall = np.minimum(
+            np.stack([compatibility, probability, commercial, strategic], axis=1)
+            @ self._dimension_weights,
+            1.0
+        )
+        return overall, compatibility, probability, commercial, strategic
     
     def _create_match_result(self, source: Dict, match_score: Dict, 
-                           intelligence: Dict, profile) -> MatchResult:
-        """Create detailed match result object"""
+                           intelligence: Dict, profile) -> Dict[str, Any]:
+        """Create the detailed match result dict for a final pick"""
         
         # Calculate success probability (combination of approval probability and compatibility)
         success_probability = (
@@ -478,26 +492,21 @@ class RecommendationMatcher:
         else:
             broker_commission = "Contact for details"
         
-        # Generate requirements and next steps
-        requirements = self._generate_requirements(source, intelligence)
-        next_steps = self._generate_next_steps(source, profile)
-        reasoning = self._generate_reasoning(match_score, source, intelligence)
-        
-        return MatchResult(
-            source_id=source["source_id"],
-            source_name=source["name"],
-            funding_type=source["type"],
-            overall_score=match_score["overall_score"],
-            score_breakdown=match_score,
-            success_probability=success_probability,
-            amount_range=amount_range,
-            timeline=source.get("market_adjusted_timeline", source["approval_timeline"]),
-            broker_commission=broker_commission,
-            requirements=requirements,
-            contact=source.get("contact", {}),
-            next_steps=next_steps,
-            reasoning=reasoning
-        )
+        return {
+            "source_id": source["source_id"],
+            "source_name": source["name"],
+            "funding_type": source["type"],
+            "overall_score": round(match_score["overall_score"], 3),
+            "score_breakdown": {k: round(match_score[k], 3) for k in _SCORE_KEYS},
+            "success_probability": round(success_probability, 3),
+            "amount_range": amount_range,
+            "timeline": source.get("market_adjusted_timeline", source["approval_timeline"]),
+            "broker_commission": broker_commission,
+            "requirements": self._generate_requirements(source, intelligence),
+            "contact": source.get("contact", {}),
+            "next_steps": self._generate_next_steps(source, profile),
+            "reasoning": self._generate_reasoning(match_score, source, intelligence)
+        }
     
     def _generate_requirements(self, source: Dict, intelligence: Dict) -> List[str]:
         """Generate key requirements for funding application"""
@@ -528,32 +537,13 @@ class RecommendationMatcher:
     
     def _generate_next_steps(self, source: Dict, profile) -> List[str]:
         """Generate actionable next steps"""
-        steps = []
-        
-        # Document preparation
-        if source["type"] in ["bank_loan", "asset_finance"]:
-            steps.extend([
-                "Prepare 3 years of audited accounts",
-                "Gather recent bank statements",
-                "Complete business plan summary"
-            ])
-        elif source["type"] in ["venture_capital", "angel_investment"]:
-            steps.extend([
-                "Prepare investor pitch deck",
-                "Document growth strategy",
-                "Prepare financial projections"
-            ])
-        elif source["type"] == "government_grant":
-            steps.extend([
-                "Review eligibility criteria in detail",
-                "Prepare innovation/project plan",
-                "Complete online application"
-            ])
+        # Document preparation from the per-type template
+        steps = list(_NEXT_STEPS_BY_TYPE.get(source["type"], ()))
         
         # Contact step
-        contact_info = source.get("contact", {})
-        if contact_info.get("email"):
-            steps.append(f"Contact via {contact_info['email']}")
+        email = source.get("contact", {}).get("email")
+        if email:
+            steps.append(f"Contact via {email}")
         
         return steps[:4]  # Limit to top 4
     
@@ -584,44 +574,43 @@ class RecommendationMatcher:
         else:
             return "Solid match across multiple criteria."
     
-    def _rank_and_diversify_matches(self, matches: List[MatchResult]) -> List[MatchResult]:
-        """Sort matches by score and apply diversity rules"""
-        # Sort by overall score
-        sorted_matches = sorted(matches, key=lambda x: x.overall_score, reverse=True)
-        
-        # Apply diversity rules (max 2 per funding type)
-        diversified_matches = []
-        type_counts = {}
-        
-        for match in sorted_matches:
-            funding_type = match.funding_type
-            current_count = type_counts.get(funding_type, 0)
-            
-            if current_count < CONFIG.DIVERSITY_REQUIREMENT:
-                diversified_matches.append(match)
-                type_counts[funding_type] = current_count + 1
-        
-        return diversified_matches
-    
-    def _match_result_to_dict(self, match: MatchResult) -> Dict[str, Any]:
-        """Convert MatchResult to dictionary"""
-        return {
-            "source_id": match.source_id,
-            "source_name": match.source_name,
-            "funding_type": match.funding_type,
-            "overall_score": round(match.overall_score, 3),
-            "score_breakdown": {
-                k: round(v, 3) for k, v in match.score_breakdown.items()
-            },
-            "success_probability": round(match.success_probability, 3),
-            "amount_range": match.amount_range,
-            "timeline": match.timeline,
-            "broker_commission": match.broker_commission,
-            "requirements": match.requirements,
-            "contact": match.contact,
-            "next_steps": match.next_steps,
-            "reasoning": match.reasoning
-        }
+    def _select_top_matches(self, overall: "np.ndarray", sources: List[Dict]) -> List[int]:
+        """Pick the top source indices by score under the diversity cap.
+
+        Ranks the qualifying scores with a stable C-level argsort and
+        walks them with a fixed-size per-type counter array, stopping as
+        soon as max_recommendations are accepted. A top-k argpartition
+        preselection was considered but can change results under the
+        per-type cap, which may reach past the k boundary.
+        """
+        qualified = np.nonzero(overall >= self.min_score_threshold)[0]
+        if qualified.size == 0:
+            return []
+
+        order = qualified[np.argsort(-overall[qualified], kind="stable")]
+        type_counts = np.zeros(TYPE_UNKNOWN + 1, dtype=np.intp)
+        unknown_counts = {}  # types outside the code vocabulary keep their own caps
+        selected = []
+
+        for i in order:
+            # Type codes were cached on the source dicts during scoring
+            type_code = int(sources[i]["_match_cols"][0])
+            if type_code == TYPE_UNKNOWN:
+                funding_type = sources[i].get("type")
+                count = unknown_counts.get(funding_type, 0)
+                if count >= CONFIG.DIVERSITY_REQUIREMENT:
+                    continue
+                unknown_counts[funding_type] = count + 1
+            else:
+                if type_counts[type_code] >= CONFIG.DIVERSITY_REQUIREMENT:
+                    continue
+                type_counts[type_code] += 1
+
+            selected.append(int(i))
+            if len(selected) == self.max_recommendations:
+                break
+
+        return selected
     
     def _create_fallback_matches(self, profile) -> List[Dict]:
         """Create basic fallback matches if main matching fails"""
@@ -650,17 +639,5 @@ class RecommendationMatcher:
     
     def get_matching_statistics(self) -> Dict[str, Any]:
         """Get statistics about matching performance"""
-        return {
-            "scoring_framework": {
-                "dimensions": 4,
-                "weights": self.scoring_weights,
-                "min_threshold": self.min_score_threshold
-            },
-            "quality_controls": {
-                "max_recommendations": self.max_recommendations,
-                "diversity_requirement": CONFIG.DIVERSITY_REQUIREMENT,
-                "confidence_threshold": CONFIG.CONFIDENCE_THRESHOLD
-            },
-            "algorithm_version": "1.0.0",
-            "last_updated": "2025-09-06"
-        }
+        # Shallow copy so callers can annotate without touching the template
+        return dict(self._stats_template)
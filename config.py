@@ -8,7 +8,11 @@ Configuration file for UK Capital Recommender System
 Contains all variables, settings, and parameters for the recommendation engine.
 """
 
+import logging
+import math
 import os
+from dataclasses import dataclass
+from types import MappingProxyType
 from typing import Dict, List, Any
 
 # ==================== SYSTEM CONFIGURATION ====================
@@ -18,57 +22,69 @@ AUTHOR = "Sotiris Spyrou, CEO, VerityAI"
 CREATED_DATE = "2025-09-06"
 
 # ==================== CORE SETTINGS ====================
+# No slots=True: dataclass slots need Python 3.10 and the documented
+# floor is 3.8; frozen alone gives the read-only guarantee we rely on
+@dataclass(frozen=True)
 class RecommenderConfig:
+    # System Identity (mirrors the module-level constants above)
+    SYSTEM_NAME: str = SYSTEM_NAME
+    SYSTEM_VERSION: str = SYSTEM_VERSION
+
     # Target Market
-    TARGET_COUNTRY = "UK"
-    SUPPORTED_REGIONS = ["England", "Scotland", "Wales", "Northern Ireland"]
-    PRIMARY_USERS = "financial_brokers"
-    
+    TARGET_COUNTRY: str = "UK"
+    SUPPORTED_REGIONS: tuple = ("England", "Scotland", "Wales", "Northern Ireland")
+    PRIMARY_USERS: str = "financial_brokers"
+
     # Recommendation Parameters
-    MAX_RECOMMENDATIONS = 5
-    MIN_MATCH_SCORE = 0.6
-    CONFIDENCE_THRESHOLD = 0.7
-    DIVERSITY_REQUIREMENT = 2  # Max per funding type
-    
+    MAX_RECOMMENDATIONS: int = 5
+    MIN_MATCH_SCORE: float = 0.6
+    CONFIDENCE_THRESHOLD: float = 0.7
+    DIVERSITY_REQUIREMENT: int = 2  # Max per funding type
+
     # Performance Settings
-    PROCESSING_TIMEOUT = 30  # seconds
-    MAX_CONCURRENT_REQUESTS = 10
-    CACHE_DURATION = 3600  # 1 hour
-    
+    PROCESSING_TIMEOUT: int = 30  # seconds
+    MAX_CONCURRENT_REQUESTS: int = 10
+    CACHE_DURATION: int = 3600  # 1 hour
+
     # Learning & Analytics
-    LEARNING_MODE = True
-    SUCCESS_TRACKING = True
-    PERFORMANCE_MONITORING = True
-    
+    LEARNING_MODE: bool = True
+    SUCCESS_TRACKING: bool = True
+    PERFORMANCE_MONITORING: bool = True
+
     # Compliance
-    REGULATORY_COMPLIANCE = "FCA"
-    DATA_PROTECTION = "GDPR"
-    AUDIT_LOGGING = True
+    REGULATORY_COMPLIANCE: str = "FCA"
+    DATA_PROTECTION: str = "GDPR"
+    AUDIT_LOGGING: bool = True
 
 # ==================== SCORING WEIGHTS ====================
-SCORING_WEIGHTS = {
+SCORING_WEIGHTS = MappingProxyType({
     "compatibility": 0.40,      # Sector, stage, geography alignment
     "approval_probability": 0.35,  # Historical success rates
     "commercial_value": 0.15,   # Broker commission potential
     "strategic_fit": 0.10       # Long-term relationship value
-}
+})
+
+# The weights must form a convex combination; fail fast at import where
+# any regression would originate
+assert math.isclose(
+    math.fsum(SCORING_WEIGHTS.values()), 1.0, abs_tol=1e-9), SCORING_WEIGHTS
 
 # ==================== BUSINESS CLASSIFICATION ====================
-BUSINESS_STAGES = {
+BUSINESS_STAGES = MappingProxyType({
     "startup": {"min_age": 0, "max_age": 2, "characteristics": ["innovation", "high_growth_potential"]},
     "growth": {"min_age": 2, "max_age": 7, "characteristics": ["scaling", "market_expansion"]},
     "mature": {"min_age": 7, "max_age": 50, "characteristics": ["established", "stable_revenue"]},
     "recovery": {"min_age": 1, "max_age": 50, "characteristics": ["restructuring", "turnaround"]}
-}
+})
 
-COMPANY_SIZES = {
+COMPANY_SIZES = MappingProxyType({
     "micro": {"employees": "1-9", "revenue_max": 632000},
     "small": {"employees": "10-49", "revenue_max": 10200000},
     "medium": {"employees": "50-249", "revenue_max": 50000000},
     "large": {"employees": "250+", "revenue_min": 50000000}
-}
+})
 
-UK_SECTORS = {
+UK_SECTORS = MappingProxyType({
     "technology": {"sic_codes": ["62", "63"], "risk_level": "medium", "growth_potential": "high"},
     "manufacturing": {"sic_codes": ["10-33"], "risk_level": "medium", "growth_potential": "medium"},
     "retail": {"sic_codes": ["45-47"], "risk_level": "high", "growth_potential": "medium"},
@@ -77,10 +93,10 @@ UK_SECTORS = {
     "construction": {"sic_codes": ["41-43"], "risk_level": "high", "growth_potential": "medium"},
     "finance": {"sic_codes": ["64-66"], "risk_level": "medium", "growth_potential": "medium"},
     "education": {"sic_codes": ["85"], "risk_level": "low", "growth_potential": "low"}
-}
+})
 
 # ==================== FUNDING SOURCE TYPES ====================
-FUNDING_TYPES = {
+FUNDING_TYPES = MappingProxyType({
     "bank_loan": {
         "typical_range": "£5k-£250k",
         "approval_timeline": "2-6 weeks",
@@ -117,10 +133,10 @@ FUNDING_TYPES = {
         "repayment": "none",
         "broker_commission": "5-15%"
     }
-}
+})
 
 # ==================== UK REGIONS ====================
-UK_REGIONS = {
+UK_REGIONS = MappingProxyType({
     "london": {"population": 9500000, "business_density": "very_high", "funding_availability": "excellent"},
     "south_east": {"population": 9270000, "business_density": "high", "funding_availability": "good"},
     "north_west": {"population": 7420000, "business_density": "medium", "funding_availability": "good"},
@@ -129,28 +145,36 @@ UK_REGIONS = {
     "west_midlands": {"population": 6000000, "business_density": "medium", "funding_availability": "fair"},
     "wales": {"population": 3130000, "business_density": "low", "funding_availability": "fair"},
     "northern_ireland": {"population": 1900000, "business_density": "low", "funding_availability": "limited"}
-}
+})
+
+# ==================== CATEGORICAL CODES ====================
+# Integer codes for the sector/region vocabularies, assigned in table
+# order. Scoring paths compare these (and bitmasks derived from them)
+# instead of hashing strings per pair.
+SECTOR_CODE = MappingProxyType({name: i for i, name in enumerate(UK_SECTORS)})
+REGION_CODE = MappingProxyType({name: i for i, name in enumerate(UK_REGIONS)})
 
 # ==================== ERROR HANDLING ====================
-ERROR_CODES = {
+ERROR_CODES = MappingProxyType({
     "INVALID_INPUT": 1001,
     "INSUFFICIENT_DATA": 1002,
     "NO_MATCHES_FOUND": 1003,
     "API_TIMEOUT": 1004,
     "SYSTEM_OVERLOAD": 1005,
     "COMPLIANCE_VIOLATION": 1006
-}
+})
 
-ERROR_MESSAGES = {
+ERROR_MESSAGES = MappingProxyType({
     1001: "Invalid business profile data provided",
     1002: "Insufficient information to generate recommendations", 
     1003: "No suitable funding sources found for this profile",
     1004: "External API request timed out",
     1005: "System temporarily overloaded, please retry",
     1006: "Request violates regulatory compliance rules"
-}
+})
 
 # Export main configuration
 CONFIG = RecommenderConfig()
 
-print(f"Configuration loaded: {SYSTEM_NAME} v{SYSTEM_VERSION}")
+logging.getLogger(__name__).debug(
+    "Configuration loaded: %s v%s", SYSTEM_NAME, SYSTEM_VERSION)
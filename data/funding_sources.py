@@ -9,17 +9,112 @@ Manages funding source data with comprehensive UK market coverage.
 """
 
 import json
+import os
+import sys
+from collections import Counter, defaultdict
 from datetime import datetime
+from types import MappingProxyType
 from typing import Dict, List, Any, Optional
 
+import numpy as np
+
+# Allow running this module as a script from the data/ directory
+# (idempotent so library imports don't grow sys.path)
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
+
+from config import UK_SECTORS
+
 class FundingSourcesDB:
     """
     Comprehensive funding sources database for UK market.
     """
     
     def __init__(self):
-        self.sources = self._create_comprehensive_sources()
+        # Tuple: the catalog is fixed after construction, so read paths
+        # can hand it out without defensive list copies
+        self.sources = tuple(self._create_comprehensive_sources())
         self.last_updated = datetime.now()
+        self._last_updated_iso = self.last_updated.isoformat()
+
+        # Lookup indexes, built once over the static source list
+        self._by_id = {source["source_id"]: source for source in self.sources}
+        self._by_type = defaultdict(list)
+        for source in self.sources:
+            self._by_type[source["type"]].append(source)
+
+        # Columnar amount bounds for vectorized range queries
+        count = len(self.sources)
+        self._amin = np.fromiter(
+            (s["amount_range"]["min"] for s in self.sources), dtype=np.int64, count=count)
+        self._amax = np.fromiter(
+            (s["amount_range"]["max"] for s in self.sources), dtype=np.int64, count=count)
+
+        # Columnar (structure-of-arrays) view of the catalog for bulk
+        # scoring: categorical fields are interned to integer codes and
+        # numeric fields sit in contiguous arrays, so the matching engine
+        # can scan all rows without per-source dict hashing
+        self._type_codes = {
+            name: code for code, name in
+            enumerate(dict.fromkeys(s["type"] for s in self.sources))
+        }
+        self._category_codes = {
+            name: code for code, name in
+            enumerate(dict.fromkeys(s["category"] for s in self.sources))
+        }
+        # Sector membership as uint64 bitmasks: one bit per known sector
+        # (config vocabulary first, then catalog-observed extras), so a
+        # business/source sector test is a single AND instead of string
+        # set intersection.  "all" claims every bit.
+        sector_names = dict.fromkeys(UK_SECTORS)
+        for s in self.sources:
+            sector_names.update(dict.fromkeys(s["sectors"]))
+            sector_names.update(dict.fromkeys(s["excluded_sectors"]))
+        sector_names.pop("all", None)
+        self._sector_bit = {name: 1 << i for i, name in enumerate(sector_names)}
+        all_bits = (1 << len(self._sector_bit)) - 1
+        self._sectors_mask = np.fromiter(
+            (all_bits if "all" in s["sectors"] else
+             sum(self._sector_bit[name] for name in s["sectors"])
+             for s in self.sources),
+            dtype=np.uint64, count=count)
+        self._excluded_mask = np.fromiter(
+            (sum(self._sector_bit[name] for name in s["excluded_sectors"])
+             for s in self.sources),
+            dtype=np.uint64, count=count)
+
+        self.columns = {
+            "type": np.fromiter(
+                (self._type_codes[s["type"]] for s in self.sources),
+                dtype=np.int16, count=count),
+            "category": np.fromiter(
+                (self._category_codes[s["category"]] for s in self.sources),
+                dtype=np.int16, count=count),
+            "min_amount": self._amin,
+            "max_amount": self._amax,
+            "min_trading_years": np.fromiter(
+                (s.get("min_trading_years", 0) for s in self.sources),
+                dtype=np.int16, count=count),
+            "sectors_mask": self._sectors_mask,
+            "excluded_mask": self._excluded_mask
+        }
+
+        # Aggregates are fixed once the source list is built, so compute
+        # them here and hand out the same read-only mapping on every
+        # get_database_stats call
+        self._stats = MappingProxyType({
+            "total_sources": len(self.sources),
+            "by_type": MappingProxyType(
+                dict(Counter(s["type"] for s in self.sources))),
+            "by_category": MappingProxyType(
+                dict(Counter(s["category"] for s in self.sources))),
+            "amount_ranges": MappingProxyType({
+                "min_amount": min(s["amount_range"]["min"] for s in self.sources),
+                "max_amount": max(s["amount_range"]["max"] for s in self.sources)
+            }),
+            "last_updated": self._last_updated_iso
+        })
     
     def _create_comprehensive_sources(self) -> List[Dict]:
         """Create comprehensive UK funding sources database"""
@@ -135,57 +230,26 @@ class FundingSourcesDB:
             }
         ]
     
-    def get_all_sources(self) -> List[Dict]:
-        """Get all funding sources"""
-        return self.sources.copy()
-    
+    def get_all_sources(self) -> tuple:
+        """Get all funding sources (read-only view; do not mutate entries)"""
+        return self.sources
+
     def get_source_by_id(self, source_id: str) -> Optional[Dict]:
-        """Get funding source by ID"""
-        for source in self.sources:
-            if source["source_id"] == source_id:
-                return source.copy()
-        return None
+        """Get funding source by ID (read-only view; do not mutate)"""
+        return self._by_id.get(source_id)
     
     def get_sources_by_type(self, funding_type: str) -> List[Dict]:
         """Get sources by funding type"""
-        return [s for s in self.sources if s["type"] == funding_type]
+        return list(self._by_type.get(funding_type, ()))
     
     def get_sources_by_amount(self, amount: float) -> List[Dict]:
         """Get sources that accept funding amount"""
-        matches = []
-        for source in self.sources:
-            if (source["amount_range"]["min"] <= amount <= source["amount_range"]["max"]):
-                matches.append(source)
-        return matches
+        idx = np.nonzero((self._amin <= amount) & (self._amax >= amount))[0]
+        return [self.sources[i] for i in idx]
     
     def get_database_stats(self) -> Dict[str, Any]:
-        """Get database statistics"""
-        return {
-            "total_sources": len(self.sources),
-            "by_type": self._count_by_type(),
-            "by_category": self._count_by_category(),
-            "amount_ranges": {
-                "min_amount": min(s["amount_range"]["min"] for s in self.sources),
-                "max_amount": max(s["amount_range"]["max"] for s in self.sources)
-            },
-            "last_updated": self.last_updated.isoformat()
-        }
-    
-    def _count_by_type(self) -> Dict[str, int]:
-        """Count sources by type"""
-        types = {}
-        for source in self.sources:
-            source_type = source["type"]
-            types[source_type] = types.get(source_type, 0) + 1
-        return types
-    
-    def _count_by_category(self) -> Dict[str, int]:
-        """Count sources by category"""
-        categories = {}
-        for source in self.sources:
-            category = source["category"]
-            categories[category] = categories.get(category, 0) + 1
-        return categories
+        """Get database statistics (read-only mapping shared across calls)"""
+        return self._stats
 
 # Create singleton instance
 funding_db = FundingSourcesDB()
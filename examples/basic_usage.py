@@ -47,12 +47,12 @@ def main():
         }
     ]
     
-    for i, business in enumerate(businesses):
+    # Process all profiles in one batch, then iterate for presentation
+    results = orchestrator.process_batch(businesses)
+
+    for i, (business, result) in enumerate(zip(businesses, results)):
         print(f"\n--- EXAMPLE {i+1}: {business['company_name']} ---")
-        
-        # Process recommendation
-        result = orchestrator.process_recommendation_request(business)
-        
+
         if result["success"]:
             print(f"✅ Generated {len(result['recommendations'])} recommendations")
             print(f"⏱️  Processing time: {result['execution_time']}s")
@@ -9,11 +9,19 @@ Main orchestrator for the UK Capital Recommender System.
 Coordinates multi-agent workflow for intelligent funding recommendations.
 """
 
+import copy
 import json
+from bisect import bisect_right
+import secrets
 import time
 import logging
+from collections import OrderedDict
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from functools import lru_cache
+from operator import itemgetter
+from typing import Dict, List, Any, Optional, Tuple
+
+import numpy as np
 
 # Import local modules
 from config import (
@@ -28,8 +36,234 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Bound on cached recommendation results per orchestrator
+_RESULT_CACHE_SIZE = 1024
+
+# Required profile fields, fetched with one C-level itemgetter call
+_REQUIRED_FIELDS = (
+    'company_name', 'sector', 'annual_revenue', 'employees', 'location',
+    'funding_amount'
+)
+_REQUIRED_GETTER = itemgetter(*_REQUIRED_FIELDS)
+
+# Lowercase and replace spaces with underscores in one translate pass
+_BUSINESS_ID_TABLE = str.maketrans(
+    ' ABCDEFGHIJKLMNOPQRSTUVWXYZ', '_abcdefghijklmnopqrstuvwxyz')
+
+# Confidence buckets: average match score thresholds and their labels
+_CONFIDENCE_THRESHOLDS = (0.65, 0.75, 0.85)
+_CONFIDENCE_LABELS = ("low", "medium", "high", "very_high")
+
+# Static simulated funding catalog, built once at import. Each source
+# dict carries a "_row" index into the columnar arrays below and a
+# "_sector_set" frozenset for O(1) sector membership tests.
+_SIM_SOURCES = (
+    {
+        "source_id": "barclays_business_loan",
+        "name": "Barclays Business Loan",
+        "type": "bank_loan",
+        "amount_range": {"min": 5000, "max": 250000},
+        "broker_commission": {"min": 1.5, "max": 3.0},
+        "timeline": "2-4 weeks",
+        "current_appetite": "selective",
+        "sectors": ["all"],
+        "min_trading_years": 2
+    },
+    {
+        "source_id": "uk_angel_network",
+        "name": "UK Angel Investment Network",
+        "type": "angel_investment",
+        "amount_range": {"min": 25000, "max": 500000},
+        "broker_commission": {"min": 3.0, "max": 7.0},
+        "timeline": "4-12 weeks",
+        "current_appetite": "aggressive",
+        "sectors": ["technology", "healthcare"],
+        "min_trading_years": 0
+    },
+    {
+        "source_id": "lloyds_asset_finance",
+        "name": "Lloyds Asset Finance",
+        "type": "asset_finance",
+        "amount_range": {"min": 10000, "max": 2000000},
+        "broker_commission": {"min": 2.0, "max": 5.0},
+        "timeline": "1-3 weeks",
+        "current_appetite": "aggressive",
+        "sectors": ["manufacturing", "construction", "transport"],
+        "min_trading_years": 1
+    },
+    {
+        "source_id": "crowdcube",
+        "name": "Crowdcube Equity Crowdfunding",
+        "type": "crowdfunding",
+        "amount_range": {"min": 10000, "max": 1000000},
+        "broker_commission": {"min": 3.0, "max": 8.0},
+        "timeline": "2-8 weeks",
+        "current_appetite": "neutral",
+        "sectors": ["consumer_products", "technology"],
+        "min_trading_years": 1
+    }
+)
+
+# Scoring lookup tables for the simulated catalog
+_SIM_BASE_RATES = {
+    "bank_loan": 0.65,
+    "asset_finance": 0.75,
+    "angel_investment": 0.25,
+    "venture_capital": 0.15,
+    "crowdfunding": 0.45
+}
+_SIM_APPETITE_MULT = {
+    "aggressive": 1.2,
+    "neutral": 1.0,
+    "selective": 0.8,
+    "cautious": 0.6
+}
+_SIM_STRATEGIC_FIT = {
+    "angel_investment": 0.8,
+    "venture_capital": 0.8,
+    "bank_loan": 0.6,
+    "asset_finance": 0.6
+}
+
+
+def _build_sim_columns(sources) -> Dict[str, np.ndarray]:
+    """Build structure-of-arrays scoring columns for the simulated catalog"""
+    count = len(sources)
+    for row, source in enumerate(sources):
+        source["_row"] = row
+        source["_sector_set"] = frozenset(source["sectors"])
+        # Output strings are a function of the static source alone
+        amount_range = source["amount_range"]
+        commission = source["broker_commission"]
+        source["_amount_range_str"] = (
+            f"£{amount_range['min']:,} - £{amount_range['max']:,}")
+        source["_commission_str"] = (
+            f"{commission['min']:.1f}%-{commission['max']:.1f}%")
+    amount_min = np.fromiter(
+        (s["amount_range"]["min"] for s in sources), dtype=np.float64, count=count)
+    amount_max = np.fromiter(
+        (s["amount_range"]["max"] for s in sources), dtype=np.float64, count=count)
+    commission = [s["broker_commission"] for s in sources]
+    return {
+        "amount_min": amount_min,
+        "amount_max": amount_max,
+        "amount_mid": (amount_min + amount_max) / 2,
+        "min_years": np.fromiter(
+            (s["min_trading_years"] for s in sources), dtype=np.float64, count=count),
+        "base_rate": np.fromiter(
+            (_SIM_BASE_RATES.get(s["type"], 0.5) for s in sources),
+            dtype=np.float64, count=count),
+        "appetite_mult": np.fromiter(
+            (_SIM_APPETITE_MULT.get(s.get("current_appetite", "neutral"), 1.0)
+             for s in sources),
+            dtype=np.float64, count=count),
+        "strategic": np.fromiter(
+            (_SIM_STRATEGIC_FIT.get(s["type"], 0.4) for s in sources),
+            dtype=np.float64, count=count),
+        "commission_mid": np.fromiter(
+            ((c["min"] + c["max"]) / 2 for c in commission),
+            dtype=np.float64, count=count)
+    }
+
+
+_SIM_COLS = _build_sim_columns(_SIM_SOURCES)
+
+
+def _build_sector_tables(sources):
+    """Precompute per-sector eligibility and sector-bonus rows.
+
+    For every sector in the config vocabulary (plus any named by the
+    catalog itself) build one boolean row over the sources, so request
+    time does a single dict lookup instead of per-source membership
+    tests. Unknown sectors fall back to the "all"-sector sources only.
+    """
+    names = set(UK_SECTORS)
+    for source in sources:
+        names.update(source["_sector_set"])
+    names.discard("all")
+    eligible = {
+        name: np.fromiter(
+            ("all" in s["_sector_set"] or name in s["_sector_set"] for s in sources),
+            dtype=bool, count=len(sources))
+        for name in names
+    }
+    # Sector bonus only counts an explicit listing, not "all"
+    hit = {
+        name: np.fromiter(
+            (name in s["_sector_set"] for s in sources),
+            dtype=np.float64, count=len(sources))
+        for name in names
+    }
+    default_eligible = np.fromiter(
+        ("all" in s["_sector_set"] for s in sources), dtype=bool, count=len(sources))
+    return eligible, hit, default_eligible
+
+
+_SIM_SECTOR_OK, _SIM_SECTOR_HIT, _SIM_SECTOR_DEFAULT = _build_sector_tables(_SIM_SOURCES)
+_SIM_NO_HIT = np.zeros(len(_SIM_SOURCES))
+
+# 4D weight vector in scoring-dimension order, for a single dot product
+_SIM_WEIGHTS = np.array([
+    SCORING_WEIGHTS["compatibility"],
+    SCORING_WEIGHTS["approval_probability"],
+    SCORING_WEIGHTS["commercial_value"],
+    SCORING_WEIGHTS["strategic_fit"]
+])
+
+
+@lru_cache(maxsize=1024)
+def _analyze_business(sector: str, location: str, annual_revenue: float,
+                      business_age: int, funding_amount: float) -> Dict:
+    """Pure simulated business analysis, memoized on its exact inputs"""
+    # Determine business stage
+    if business_age <= 2:
+        stage = "startup"
+    elif business_age <= 7:
+        stage = "growth"
+    else:
+        stage = "mature"
+
+    # Calculate risk level
+    sector_risk = UK_SECTORS.get(sector, {}).get("risk_level", "medium")
+
+    # Calculate creditworthiness
+    revenue_score = min(annual_revenue / 1000000, 1.0)
+    age_score = min(business_age / 10, 1.0)
+    creditworthiness = (revenue_score * 0.6 + age_score * 0.4)
+
+    # Calculate funding readiness
+    funding_ratio = funding_amount / max(annual_revenue, 1)
+    readiness_base = 0.8 if funding_ratio <= 0.5 else 0.6 if funding_ratio <= 1.0 else 0.4
+
+    return {
+        "business_profile": {
+            "risk_level": sector_risk,
+            "stage": stage,
+            "creditworthiness": creditworthiness,
+            "growth_trajectory": "accelerating" if stage == "startup" else "stable",
+            "funding_readiness": readiness_base,
+            "sector_attractiveness": UK_SECTORS.get(sector, {}).get("growth_potential", "medium")
+        },
+        "funding_indicators": {
+            "amount_justification": "reasonable" if funding_ratio <= 1.0 else "optimistic",
+            "repayment_capacity": creditworthiness,
+            "asset_backing": 0.7 if sector in ["manufacturing", "construction"] else 0.4,
+            "management_strength": 0.75
+        },
+        "matching_tags": [sector, stage, location.lower()],
+        "red_flags": ["high_funding_ratio"] if funding_ratio > 2.0 else [],
+        "recommended_funding_types": ["bank_loan", "asset_finance"] if stage == "mature" else ["angel_investment", "vc"]
+    }
+
 class BusinessProfile:
     """Standardized business profile data structure"""
+
+    __slots__ = (
+        'company_name', 'sector', 'annual_revenue', 'employees', 'location',
+        'business_age', 'funding_amount', 'funding_purpose', 'timeline',
+        'financials'
+    )
+
     def __init__(self, data: Dict):
         self.company_name = data['company_name']
         self.sector = data['sector']
@@ -50,22 +284,35 @@ class CapitalRecommenderOrchestrator:
     
     def __init__(self):
         self.session_id = self._generate_session_id()
-        logger.info(f"Capital Recommender Orchestrator initialized - Session: {self.session_id}")
+        # LRU cache of completed recommendations keyed on the canonical
+        # profile; entries expire after CONFIG.CACHE_DURATION seconds
+        self._result_cache: "OrderedDict[Tuple, Tuple[float, Dict]]" = OrderedDict()
+        self._cache_hits = 0
+        self._cache_misses = 0
+        logger.info("Capital Recommender Orchestrator initialized - Session: %s", self.session_id)
     
     def _generate_session_id(self) -> str:
         """Generate unique session identifier"""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        return f"CR_{timestamp}_{hash(time.time()) % 10000:04d}"
+        return f"CR_{datetime.now():%Y%m%d_%H%M%S}_{secrets.token_hex(2)}"
     
     def process_recommendation_request(self, business_data: Dict) -> Dict:
         """
         Main entry point for processing funding recommendations.
         """
-        start_time = time.time()
-        business_id = business_data.get('company_name', 'unknown').replace(' ', '_').lower()
-        
+        # Monotonic integer clock: cheaper than time.time() and immune
+        # to wall-clock adjustments; also drives cache TTL arithmetic
+        start_ns = time.perf_counter_ns()
+        start_time = start_ns * 1e-9
+        business_id = business_data.get('company_name', 'unknown').translate(_BUSINESS_ID_TABLE)
+
+        cache_key = self._profile_cache_key(business_data)
+        cached = self._cache_lookup(cache_key, start_time)
+        if cached is not None:
+            logger.info("Returning cached recommendations for: %s", business_id)
+            return cached
+
         try:
-            logger.info(f"Processing recommendation request for: {business_id}")
+            logger.info("Processing recommendation request for: %s", business_id)
             
             # Step 1: Validate input data
             if not self._validate_input(business_data):
@@ -75,21 +322,21 @@ class CapitalRecommenderOrchestrator:
             business_profile = BusinessProfile(business_data)
             
             # Step 3: Business Analysis (Simulated)
-            logger.info("Executing business analysis...")
+            logger.debug("Executing business analysis...")
             business_intelligence = self._simulate_business_analysis(business_profile)
             
             # Step 4: Funding Source Research (Simulated)
-            logger.info("Researching funding sources...")
+            logger.debug("Researching funding sources...")
             available_sources = self._simulate_funding_research(business_profile, business_intelligence)
             
             # Step 5: Intelligent Matching (Simulated)
-            logger.info("Executing recommendation matching...")
+            logger.debug("Executing recommendation matching...")
             matches = self._simulate_recommendation_matching(business_intelligence, available_sources, business_profile)
             
             # Step 6: Format recommendations
             recommendations = self._format_recommendations(matches, business_profile)
-            
-            execution_time = time.time() - start_time
+
+            execution_time = (time.perf_counter_ns() - start_ns) * 1e-9
             
             result = {
                 "business_id": business_id,
@@ -100,12 +347,13 @@ class CapitalRecommenderOrchestrator:
                 "success": True
             }
             
-            logger.info(f"Recommendation completed successfully in {execution_time:.2f}s")
+            logger.info("Recommendation completed successfully in %.2fs", execution_time)
+            self._cache_store(cache_key, start_time, result)
             return result
             
         except Exception as e:
-            logger.error(f"Error processing recommendation: {str(e)}")
-            execution_time = time.time() - start_time
+            logger.error("Error processing recommendation: %s", e)
+            execution_time = (time.perf_counter_ns() - start_ns) * 1e-9
             return {
                 "business_id": business_id,
                 "recommendations": [],
@@ -116,207 +364,136 @@ class CapitalRecommenderOrchestrator:
                 "errors": [str(e)]
             }
     
+    def process_batch(self, businesses: List[Dict]) -> List[Dict]:
+        """
+        Process a batch of business profiles in one call.
+
+        Results come back in input order; each entry has the same shape
+        as process_recommendation_request, so failures are reported
+        per-profile rather than aborting the batch. Repeated profiles
+        within a batch are served from the result cache.
+        """
+        return [self.process_recommendation_request(business) for business in businesses]
+
+    def _profile_cache_key(self, data: Dict) -> Optional[Tuple]:
+        """Canonicalize a business profile dict into a hashable cache key"""
+        try:
+            cache_key = tuple(sorted(
+                (key, tuple(sorted(value.items())) if isinstance(value, dict) else value)
+                for key, value in data.items()
+            ))
+            # Probe hashability here: list-valued fields build fine but
+            # blow up later at dict lookup time
+            hash(cache_key)
+            return cache_key
+        except TypeError:
+            # Unhashable payload (e.g. list-valued fields) - skip caching
+            return None
+
+    def _cache_lookup(self, cache_key: Optional[Tuple], now: float) -> Optional[Dict]:
+        """Return a cached result if present and within CACHE_DURATION"""
+        if cache_key is None:
+            return None
+        entry = self._result_cache.get(cache_key)
+        if entry is None:
+            self._cache_misses += 1
+            return None
+        cached_at, result = entry
+        if now - cached_at > CONFIG.CACHE_DURATION:
+            del self._result_cache[cache_key]
+            self._cache_misses += 1
+            return None
+        self._result_cache.move_to_end(cache_key)
+        self._cache_hits += 1
+        return copy.deepcopy(result)
+
+    def _cache_store(self, cache_key: Optional[Tuple], now: float, result: Dict) -> None:
+        """Cache a successful result, evicting the least recently used entry"""
+        if cache_key is None:
+            return
+        self._result_cache[cache_key] = (now, copy.deepcopy(result))
+        self._result_cache.move_to_end(cache_key)
+        while len(self._result_cache) > _RESULT_CACHE_SIZE:
+            self._result_cache.popitem(last=False)
+
     def _validate_input(self, data: Dict) -> bool:
         """Validate input business data"""
-        required_fields = ['company_name', 'sector', 'annual_revenue', 'employees', 'location', 'funding_amount']
-        return all(field in data and data[field] is not None for field in required_fields)
+        try:
+            values = _REQUIRED_GETTER(data)
+        except KeyError:
+            return False
+        return None not in values
     
     def _simulate_business_analysis(self, profile: BusinessProfile) -> Dict:
         """Simulate sophisticated business analysis"""
-        # Determine business stage
-        if profile.business_age <= 2:
-            stage = "startup"
-        elif profile.business_age <= 7:
-            stage = "growth"
-        else:
-            stage = "mature"
-        
-        # Calculate risk level
-        sector_risk = UK_SECTORS.get(profile.sector, {}).get("risk_level", "medium")
-        region_risk = "low" if profile.location.lower() == "london" else "medium"
-        
-        # Calculate creditworthiness
-        revenue_score = min(profile.annual_revenue / 1000000, 1.0)
-        age_score = min(profile.business_age / 10, 1.0)
-        creditworthiness = (revenue_score * 0.6 + age_score * 0.4)
-        
-        # Calculate funding readiness
-        funding_ratio = profile.funding_amount / max(profile.annual_revenue, 1)
-        readiness_base = 0.8 if funding_ratio <= 0.5 else 0.6 if funding_ratio <= 1.0 else 0.4
-        
-        return {
-            "business_profile": {
-                "risk_level": sector_risk,
-                "stage": stage,
-                "creditworthiness": creditworthiness,
-                "growth_trajectory": "accelerating" if stage == "startup" else "stable",
-                "funding_readiness": readiness_base,
-                "sector_attractiveness": UK_SECTORS.get(profile.sector, {}).get("growth_potential", "medium")
-            },
-            "funding_indicators": {
-                "amount_justification": "reasonable" if funding_ratio <= 1.0 else "optimistic",
-                "repayment_capacity": creditworthiness,
-                "asset_backing": 0.7 if profile.sector in ["manufacturing", "construction"] else 0.4,
-                "management_strength": 0.75
-            },
-            "matching_tags": [profile.sector, stage, profile.location.lower()],
-            "red_flags": ["high_funding_ratio"] if funding_ratio > 2.0 else [],
-            "recommended_funding_types": ["bank_loan", "asset_finance"] if stage == "mature" else ["angel_investment", "vc"]
-        }
+        # The analysis is a pure function of these five fields, so
+        # repeated sector/region/amount combinations hit the memo;
+        # deep-copy keeps cached entries safe from caller mutation
+        return copy.deepcopy(_analyze_business(
+            profile.sector, profile.location, profile.annual_revenue,
+            profile.business_age, profile.funding_amount))
     
     def _simulate_funding_research(self, profile: BusinessProfile, intelligence: Dict) -> List[Dict]:
         """Simulate funding source research"""
-        sources = [
-            {
-                "source_id": "barclays_business_loan",
-                "name": "Barclays Business Loan",
-                "type": "bank_loan",
-                "amount_range": {"min": 5000, "max": 250000},
-                "broker_commission": {"min": 1.5, "max": 3.0},
-                "timeline": "2-4 weeks",
-                "current_appetite": "selective",
-                "sectors": ["all"],
-                "min_trading_years": 2
-            },
-            {
-                "source_id": "uk_angel_network",
-                "name": "UK Angel Investment Network",
-                "type": "angel_investment",
-                "amount_range": {"min": 25000, "max": 500000},
-                "broker_commission": {"min": 3.0, "max": 7.0},
-                "timeline": "4-12 weeks",
-                "current_appetite": "aggressive",
-                "sectors": ["technology", "healthcare"],
-                "min_trading_years": 0
-            },
-            {
-                "source_id": "lloyds_asset_finance",
-                "name": "Lloyds Asset Finance",
-                "type": "asset_finance",
-                "amount_range": {"min": 10000, "max": 2000000},
-                "broker_commission": {"min": 2.0, "max": 5.0},
-                "timeline": "1-3 weeks",
-                "current_appetite": "aggressive",
-                "sectors": ["manufacturing", "construction", "transport"],
-                "min_trading_years": 1
-            },
-            {
-                "source_id": "crowdcube",
-                "name": "Crowdcube Equity Crowdfunding",
-                "type": "crowdfunding",
-                "amount_range": {"min": 10000, "max": 1000000},
-                "broker_commission": {"min": 3.0, "max": 8.0},
-                "timeline": "2-8 weeks",
-                "current_appetite": "neutral",
-                "sectors": ["consumer_products", "technology"],
-                "min_trading_years": 1
-            }
-        ]
-        
-        # Filter by basic eligibility
-        eligible_sources = []
-        for source in sources:
-            # Check amount range
-            if (source["amount_range"]["min"] <= profile.funding_amount <= source["amount_range"]["max"]):
-                # Check trading years
-                if profile.business_age >= source["min_trading_years"]:
-                    # Check sector
-                    if source["sectors"] == ["all"] or profile.sector in source["sectors"]:
-                        eligible_sources.append(source)
-        
-        return eligible_sources
+        cols = _SIM_COLS
+        # Amount, trading-years and sector eligibility fused into one
+        # vectorized mask; the sector row is precomputed per sector
+        mask = (
+            (cols["amount_min"] <= profile.funding_amount)
+            & (profile.funding_amount <= cols["amount_max"])
+            & (profile.business_age >= cols["min_years"])
+            & _SIM_SECTOR_OK.get(profile.sector, _SIM_SECTOR_DEFAULT)
+        )
+        return [_SIM_SOURCES[row] for row in np.nonzero(mask)[0]]
     
     def _simulate_recommendation_matching(self, intelligence: Dict, sources: List[Dict], profile: BusinessProfile) -> List[Dict]:
         """Simulate 4D recommendation matching"""
-        matches = []
-        
-        for source in sources:
-            # Calculate 4D scores
-            compatibility = self._calculate_compatibility(source, profile, intelligence)
-            probability = self._calculate_probability(source, intelligence)
-            commercial = self._calculate_commercial_value(source, profile)
-            strategic = self._calculate_strategic_fit(source, profile)
-            
-            # Overall score
-            overall_score = (
-                compatibility * SCORING_WEIGHTS["compatibility"] +
-                probability * SCORING_WEIGHTS["approval_probability"] +
-                commercial * SCORING_WEIGHTS["commercial_value"] +
-                strategic * SCORING_WEIGHTS["strategic_fit"]
-            )
-            
-            if overall_score >= CONFIG.MIN_MATCH_SCORE:
-                matches.append({
-                    "source": source,
-                    "overall_score": overall_score,
-                    "compatibility": compatibility,
-                    "probability": probability,
-                    "commercial": commercial,
-                    "strategic": strategic,
-                    "success_probability": (probability * 0.7 + compatibility * 0.3)
-                })
-        
-        # Sort by score
-        matches.sort(key=lambda x: x["overall_score"], reverse=True)
-        return matches[:CONFIG.MAX_RECOMMENDATIONS]
-    
-    def _calculate_compatibility(self, source: Dict, profile: BusinessProfile, intelligence: Dict) -> float:
-        """Calculate compatibility score"""
-        score = 0.8  # Base score for eligible sources
-        
-        # Sector bonus
-        if profile.sector in source.get("sectors", []):
-            score += 0.1
-        
-        # Amount fit
-        mid_point = (source["amount_range"]["min"] + source["amount_range"]["max"]) / 2
-        if abs(profile.funding_amount - mid_point) < (mid_point * 0.5):
-            score += 0.1
-        
-        return min(score, 1.0)
-    
-    def _calculate_probability(self, source: Dict, intelligence: Dict) -> float:
-        """Calculate approval probability"""
-        base_rates = {
-            "bank_loan": 0.65,
-            "asset_finance": 0.75,
-            "angel_investment": 0.25,
-            "venture_capital": 0.15,
-            "crowdfunding": 0.45
-        }
-        
-        base_rate = base_rates.get(source["type"], 0.5)
+        if not sources:
+            return []
+
+        cols = _SIM_COLS
+        count = len(sources)
+        rows = np.fromiter((s["_row"] for s in sources), dtype=np.intp, count=count)
+        amount = profile.funding_amount
         creditworthiness = intelligence["business_profile"]["creditworthiness"]
-        
-        # Adjust for current appetite
-        appetite_multiplier = {
-            "aggressive": 1.2,
-            "neutral": 1.0,
-            "selective": 0.8,
-            "cautious": 0.6
-        }
-        
-        multiplier = appetite_multiplier.get(source.get("current_appetite", "neutral"), 1.0)
-        
-        return min(base_rate * creditworthiness * multiplier, 1.0)
-    
-    def _calculate_commercial_value(self, source: Dict, profile: BusinessProfile) -> float:
-        """Calculate commercial value for broker"""
-        commission = source.get("broker_commission", {})
-        if isinstance(commission, dict):
-            avg_commission = (commission.get("min", 0) + commission.get("max", 0)) / 2
-            potential_revenue = (avg_commission / 100) * profile.funding_amount
-            return min(potential_revenue / 10000, 1.0)
-        return 0.5
-    
-    def _calculate_strategic_fit(self, source: Dict, profile: BusinessProfile) -> float:
-        """Calculate strategic fit"""
-        if source["type"] in ["angel_investment", "venture_capital"]:
-            return 0.8  # High strategic value
-        elif source["type"] in ["bank_loan", "asset_finance"]:
-            return 0.6  # Medium strategic value
-        else:
-            return 0.4  # Lower strategic value
+
+        # All four dimensions as whole-array expressions over the
+        # eligible rows: base 0.8 plus sector and amount-fit bonuses,
+        # approval probability from base rate x creditworthiness x
+        # appetite, commercial value from mid commission, strategic fit
+        # from the funding type
+        sector_hit = _SIM_SECTOR_HIT.get(profile.sector, _SIM_NO_HIT)[rows]
+        mid = cols["amount_mid"][rows]
+        compatibility = np.minimum(
+            0.8 + 0.1 * sector_hit + 0.1 * (np.abs(amount - mid) < 0.5 * mid), 1.0)
+        probability = np.minimum(
+            cols["base_rate"][rows] * creditworthiness * cols["appetite_mult"][rows], 1.0)
+        commercial = np.minimum(
+            (cols["commission_mid"][rows] / 100) * amount / 10000, 1.0)
+        strategic = cols["strategic"][rows]
+
+        overall = (
+            np.stack([compatibility, probability, commercial, strategic], axis=1)
+            @ _SIM_WEIGHTS
+        )
+        success = probability * 0.7 + compatibility * 0.3
+
+        # Threshold then take the top-k qualified, preserving encounter
+        # order on score ties like the previous stable selection
+        qualified = np.nonzero(overall >= CONFIG.MIN_MATCH_SCORE)[0]
+        order = qualified[np.argsort(-overall[qualified], kind="stable")]
+        return [
+            {
+                "source": sources[i],
+                "overall_score": float(overall[i]),
+                "compatibility": float(compatibility[i]),
+                "probability": float(probability[i]),
+                "commercial": float(commercial[i]),
+                "strategic": float(strategic[i]),
+                "success_probability": float(success[i])
+            }
+            for i in order[:CONFIG.MAX_RECOMMENDATIONS]
+        ]
     
     def _format_recommendations(self, matches: List[Dict], profile: BusinessProfile) -> List[Dict]:
         """Format recommendations for output"""
@@ -325,25 +502,15 @@ class CapitalRecommenderOrchestrator:
         for i, match in enumerate(matches):
             source = match["source"]
             
-            # Format amount range
-            amount_range = f"£{source['amount_range']['min']:,} - £{source['amount_range']['max']:,}"
-            
-            # Format commission
-            commission = source.get("broker_commission", {})
-            if isinstance(commission, dict):
-                broker_commission = f"{commission.get('min', 0):.1f}%-{commission.get('max', 0):.1f}%"
-            else:
-                broker_commission = "Contact for details"
-            
             recommendation = {
                 "rank": i + 1,
                 "funding_source": source["name"],
                 "type": source["type"],
                 "match_score": round(match["overall_score"], 2),
                 "success_probability": round(match["success_probability"], 2),
-                "amount_range": amount_range,
+                "amount_range": source["_amount_range_str"],
                 "timeline": source["timeline"],
-                "broker_commission": broker_commission,
+                "broker_commission": source["_commission_str"],
                 "requirements": [f"Minimum {source.get('min_trading_years', 0)} years trading"],
                 "contact_info": {"type": "simulated"},
                 "next_steps": ["Prepare business plan", "Gather financial documents"],
@@ -357,17 +524,9 @@ class CapitalRecommenderOrchestrator:
         """Calculate overall confidence"""
         if not recommendations:
             return "none"
-        
+
         avg_score = sum(r['match_score'] for r in recommendations) / len(recommendations)
-        
-        if avg_score >= 0.85:
-            return "very_high"
-        elif avg_score >= 0.75:
-            return "high"
-        elif avg_score >= 0.65:
-            return "medium"
-        else:
-            return "low"
+        return _CONFIDENCE_LABELS[bisect_right(_CONFIDENCE_THRESHOLDS, avg_score)]
     
     def _create_error_result(self, business_id: str, error_code: int) -> Dict:
         """Create standardized error result"""
@@ -383,7 +542,7 @@ class CapitalRecommenderOrchestrator:
     
     def get_system_status(self) -> Dict:
         """Get current system status"""
-        return {
+        status = {
             "system": CONFIG.SYSTEM_NAME,
             "version": CONFIG.SYSTEM_VERSION,
             "status": "operational",
@@ -391,6 +550,13 @@ class CapitalRecommenderOrchestrator:
             "max_recommendations": CONFIG.MAX_RECOMMENDATIONS,
             "last_updated": datetime.now().isoformat()
         }
+        if CONFIG.PERFORMANCE_MONITORING:
+            status["result_cache"] = {
+                "size": len(self._result_cache),
+                "hits": self._cache_hits,
+                "misses": self._cache_misses
+            }
+        return status
 
 def main():
     """Main execution function"""
@@ -452,4 +618,17 @@ def main():
     print("   See docs/Claude.md for technical details")
 
 if __name__ == "__main__":
-    main()
+    import sys
+
+    if "--profile" in sys.argv:
+        # Deterministic profile of the full request path, hottest first
+        import cProfile
+        import pstats
+
+        profiler = cProfile.Profile()
+        profiler.enable()
+        main()
+        profiler.disable()
+        pstats.Stats(profiler).sort_stats("cumulative").print_stats(10)
+    else:
+        main()
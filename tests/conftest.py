@@ -0,0 +1,36 @@
+# tests/conftest.py
+# Shared fixtures for UK Capital Recommender System tests
+
+"""
+Session-scoped fixtures so heavy objects are constructed once per run.
+"""
+
+import sys
+import os
+
+# Add parent directory to path (idempotent so repeated imports don't
+# grow sys.path)
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
+
+import pytest
+
+from agents.business_analyzer import BusinessAnalyzer
+from main import CapitalRecommenderOrchestrator
+from data.funding_sources import funding_db
+
+
+@pytest.fixture(scope="session")
+def analyzer():
+    return BusinessAnalyzer()
+
+
+@pytest.fixture(scope="session")
+def orchestrator():
+    return CapitalRecommenderOrchestrator()
+
+
+@pytest.fixture(scope="session")
+def funding_database():
+    return funding_db